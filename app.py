@@ -4,13 +4,17 @@ A beautiful and intuitive multi-user web application for managing your personal
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from dateutil.relativedelta import relativedelta
 import calendar
+import csv
+import functools
+import io
 import os
+import random
 
 # Configure page first with default title
 st.set_page_config(
@@ -39,6 +43,8 @@ except Exception as e:
     print(f"⚠️ Backup system issue: {e}")
 
 # Import our budget manager services
+from budget_manager.core.database import DatabaseManager
+from budget_manager.services.auth_service import AuthService
 from budget_manager.services.budget_service import BudgetService
 from budget_manager.services.expense_service import ExpenseService
 from budget_manager.services.recommendation_service import RecommendationService
@@ -46,67 +52,10 @@ from budget_manager.core.models import ExpenseCategory
 from budget_manager.utils.formatters import Formatters
 from budget_manager.core.user_preferences import get_user_preferences, Currency
 from budget_manager.utils.translations import t, Language, set_language, get_current_language, is_rtl
-from auth_components import check_authentication, get_current_user_id, AuthUI
-
-# Initialize language after imports
-try:
-    prefs = get_user_preferences()
-    lang_code = prefs.get_language()
-    language = Language(lang_code)
-    set_language(language)
-except:
-    set_language(Language.ENGLISH)
-
-# RTL CSS support for Arabic
-if is_rtl():
-    st.markdown("""
-    <style>
-    .main .block-container {
-        direction: rtl;
-        text-align: right;
-    }
-    .stSelectbox > label {
-        direction: rtl;
-    }
-    .stMetric {
-        direction: rtl;
-    }
-    .stHeader {
-        direction: rtl;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-# Authentication check - must be at the top
-user = check_authentication()
-if not user:
-    # Show authentication form if user is not authenticated
-    auth_ui = AuthUI()
-    authenticated = auth_ui.render_auth_form()
-    if not authenticated:
-        st.stop()
-    user = auth_ui.get_current_user()
-
-user_id = get_current_user_id()
-
-# Initialize services with error handling for cloud deployment
-@st.cache_resource
-def get_services():
-    try:
-        return {
-            'budget': BudgetService(),
-            'expense': ExpenseService(),
-            'recommendation': RecommendationService()
-        }
-    except Exception as e:
-        st.error(f"❌ Error initializing services: {str(e)}")
-        st.info("🔄 Please refresh the page. If the error persists, try resetting the database.")
-        st.stop()
-
-services = get_services()
+from auth_components import AuthUI
 
 # Custom CSS for better styling
-st.markdown("""
+_MAIN_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -145,15 +94,208 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# RTL CSS support for Arabic
+_RTL_CSS = """
+<style>
+    .main .block-container {
+        direction: rtl;
+        text-align: right;
+    }
+    .stSelectbox > label {
+        direction: rtl;
+    }
+    .stMetric {
+        direction: rtl;
+    }
+    .stHeader {
+        direction: rtl;
+    }
+</style>
+"""
+
+# Initialize language after imports
+try:
+    prefs = get_user_preferences()
+    lang_code = prefs.get_language()
+    language = Language(lang_code)
+    set_language(language)
+except:
+    set_language(Language.ENGLISH)
+
+# Initialize services with error handling for cloud deployment
+@st.cache_resource
+def get_services():
+    try:
+        # One database manager (and connection pool) shared by every service
+        db_manager = DatabaseManager()
+        return {
+            'auth': AuthService(db_manager),
+            'budget': BudgetService(db_manager),
+            'expense': ExpenseService(db_manager),
+            'recommendation': RecommendationService(db_manager)
+        }
+    except Exception as e:
+        st.error(f"❌ Error initializing services: {str(e)}")
+        st.info("🔄 Please refresh the page. If the error persists, try resetting the database.")
+        st.stop()
+
+services = get_services()
+
+# Authentication check - must run before any page content. A single AuthUI,
+# built on the shared AuthService, serves the auth check and the sidebar user menu.
+auth_ui = AuthUI(services['auth'])
+user = auth_ui.get_current_user()
+if not user:
+    # Show authentication form if user is not authenticated
+    authenticated = auth_ui.render_auth_form()
+    if not authenticated:
+        st.stop()
+    user = auth_ui.get_current_user()
+
+user_id = auth_ui.get_current_user_id()
+
+# Cached service reads - st.cache_data is shared across sessions, so every
+# helper takes the user id as part of its cache key.
+@st.cache_data(ttl=60, show_spinner=False)
+def _daily_recommendation(uid, month):
+    return services['recommendation'].get_daily_recommendation(uid, month=month)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _summary(uid, month):
+    return services['recommendation'].get_monthly_summary(uid, month)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _progress(uid, month):
+    return services['recommendation'].get_savings_progress(uid, month)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_bundle(uid, day):
+    """Fetch everything the Dashboard reads as a single cache entry."""
+    bundle = services['recommendation'].get_dashboard_bundle(uid, day)
+    return (
+        bundle['recommendation'],
+        bundle['summary'],
+        bundle['alerts'],
+        bundle['progress'],
+        services['expense'].get_expenses(uid, limit=5)
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _monthly_totals(uid, start_date, end_date):
+    return services['expense'].get_monthly_totals(uid, start_date, end_date)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _filtered_expenses(uid, start_date, category, limit):
+    return services['expense'].get_expenses(
+        user_id=uid,
+        start_date=start_date,
+        category=category,
+        limit=limit
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _expense_summary(uid, start_date, category):
+    return services['expense'].get_expense_summary(
+        user_id=uid,
+        start_date=start_date,
+        category=category
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _today_total(uid, day):
+    return services['expense'].get_total_expenses(user_id=uid, start_date=day, end_date=day)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _today_expenses(uid, day):
+    return services['expense'].get_expenses(user_id=uid, start_date=day, end_date=day)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _data_counts(uid):
+    stats = services['auth'].get_user_stats(uid) or {}
+    return (
+        stats.get('total_expenses', 0),
+        stats.get('income_entries', 0),
+        stats.get('savings_goals', 0)
+    )
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _connection_ok():
+    return services['auth'].db_manager.test_connection()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _system_stats():
+    return services['auth'].get_system_stats()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _users_with_stats():
+    return services['auth'].get_all_users(), services['auth'].get_all_user_stats()
+
+def _clear_cached_reads():
+    """Invalidate cached service reads after a write."""
+    for cached in (_daily_recommendation, _summary, _progress,
+                   _dashboard_bundle, _monthly_totals, _filtered_expenses, _expense_summary, _today_total,
+                   _today_expenses, _data_counts, _system_stats, _users_with_stats):
+        cached.clear()
+
+def _build_expenses_csv(expense_service, uid):
+    """Build the CSV export of all of a user's expenses."""
+    # Stream rows from the database straight into the CSV buffer; amounts are
+    # written from their Decimal values so no precision is lost through float
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['Date', 'Amount', 'Description', 'Category'])
+    writer.writerows(
+        (expense_date.isoformat(), str(amount), description, category.value)
+        for expense_date, amount, description, category
+        in expense_service.iter_export_rows(uid)
+    )
+    return buffer.getvalue()
+
+def _reset_database():
+    """Delete all data, drop all cached reads and sign out the now-deleted user."""
+    # The shared services keep their engine; only the data is gone
+    services['expense'].db_manager.reset_database()
+    st.cache_data.clear()
+    auth_ui.logout()
+
+# User preferences are read once per rerun and shared by every page
+prefs = get_user_preferences()
+currency_code = prefs.get_currency_code()
+
+# Month selector options for the current year, shared by every month picker
+_now = datetime.now()
+_MONTH_OPTIONS = tuple(f"{_now.year}-{i:02d}" for i in range(1, 13))
+_CURRENT_MONTH_INDEX = _now.month - 1
+
+# Currency selector options and an O(1) index lookup
+_CURRENCIES = tuple(Currency)
+_CURRENCY_INDEX = {curr: i for i, curr in enumerate(_CURRENCIES)}
+
+# Expense category selector options and their display labels
+_EXPENSE_CATEGORY_VALUES = tuple(cat.value for cat in ExpenseCategory)
+_EXPENSE_CATEGORY_LABELS = {value: value.title() for value in _EXPENSE_CATEGORY_VALUES}
+
+# Rows per page in the Multi-User users table
+_USERS_PAGE_SIZE = 25
+
+# Amount shown in the formatting preview; its formatted text is memoized by
+# Formatters per (symbol, decimal places, thousands separator)
+_SAMPLE_AMOUNT = Decimal("12345.67")
+
+# Main styles plus the RTL overrides for Arabic, sent as a single element
+st.markdown(_RTL_CSS + _MAIN_CSS if is_rtl() else _MAIN_CSS, unsafe_allow_html=True)
 
 # Sidebar navigation
 st.sidebar.title(f"🏦 {t('navigation')}")
 
 # Add user menu in sidebar
-auth_ui = AuthUI()
 auth_ui.render_user_menu()
 
+# Translated page names, built once per rerun for both navigation paths
+page_options = [f"📊 {t('dashboard')}", f"💰 {t('income_goals')}", f"💸 {t('expenses')}", f"📈 {t('reports')}", f"⚙️ {t('settings')}"]
+
 # Handle navigation via session state or selectbox
 if 'nav_page' in st.session_state and st.session_state.nav_page:
     # Use session state navigation if set
@@ -161,7 +303,6 @@ if 'nav_page' in st.session_state and st.session_state.nav_page:
     st.session_state.nav_page = None  # Clear after use
     
     # Update selectbox to match navigation
-    page_options = [f"📊 {t('dashboard')}", f"💰 {t('income_goals')}", f"💸 {t('expenses')}", f"📈 {t('reports')}", f"⚙️ {t('settings')}"]
     try:
         page_index = page_options.index(page)
     except ValueError:
@@ -179,40 +320,76 @@ else:
     # Normal selectbox navigation
     page = st.sidebar.selectbox(
         t("choose_option"),
-        [f"📊 {t('dashboard')}", f"💰 {t('income_goals')}", f"💸 {t('expenses')}", f"📈 {t('reports')}", f"⚙️ {t('settings')}"]
+        page_options
     )
 
 # Main title with user welcome
 col1, col2 = st.columns([3, 1])
 with col1:
-    st.markdown(f'<h1 class="main-header">💰 {t("welcome_message", user.full_name or user.username)}</h1>', unsafe_allow_html=True)
+    st.markdown(f'<h1 class="main-header">💰 {t("welcome_message", user.display_name)}</h1>', unsafe_allow_html=True)
 with col2:
     if st.button(f"🚪 {t('logout')}", key="main_logout"):
         auth_ui.logout()
 
 def format_currency(amount):
     """Format currency with user preferences."""
-    from decimal import Decimal
-    return Formatters.format_currency(Decimal(str(amount)))
+    # Decimals from the services are formatted as they are; only floats need converting
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return Formatters.format_currency(amount)
 
-def create_progress_bar(current, target, label):
-    """Create a custom progress bar."""
-    if target > 0:
-        progress = min(current / target, 1.0)
-        percentage = (current / target) * 100
-    else:
-        progress = 0
-        percentage = 0
+# Plotly configs: gauges and pies are read-only, the rest keep hover but drop the modebar
+_STATIC_CHART_CONFIG = {'displayModeBar': False, 'staticPlot': True}
+_CHART_CONFIG = {'displayModeBar': False, 'scrollZoom': False}
+
+def create_line_chart(df, **kwargs):
+    """Create a line chart, using the WebGL renderer for large frames."""
+    import plotly.express as px
+    
+    render_mode = 'webgl' if len(df) > 1000 else 'svg'
+    return px.line(df, render_mode=render_mode, **kwargs)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_goal_gauge(actual, target):
+    """Create the savings goal vs actual gauge."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode = "number+gauge+delta",
+        value = actual,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Savings Goal Achievement"},
+        delta = {'reference': target},
+        gauge = {
+            'axis': {'range': [None, target * 1.5]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, target], 'color': "lightgray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': target
+            }
+        }
+    ))
+    
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_achievement_gauge(percentage):
+    """Create the goal achievement percentage gauge."""
+    import plotly.graph_objects as go
     
     fig = go.Figure(go.Indicator(
-        mode = "gauge+number+delta",
+        mode = "gauge+number",
         value = percentage,
         domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': label},
-        delta = {'reference': 100},
+        title = {'text': "Goal Achievement"},
         gauge = {
             'axis': {'range': [None, 150]},
-            'bar': {'color': "darkblue"},
+            'bar': {'color': "darkgreen"},
             'steps': [
                 {'range': [0, 50], 'color': "lightgray"},
                 {'range': [50, 100], 'color': "gray"}
@@ -225,9 +402,608 @@ def create_progress_bar(current, target, label):
         }
     ))
     
-    fig.update_layout(height=300)
+    # Keep the same uirevision so plotly.js updates the gauge in place across reruns
+    fig.update_layout(height=400, uirevision='goal-gauge')
     return fig
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_category_charts(categories, amounts, amount_label):
+    """Create the dashboard category pie and bar charts."""
+    import plotly.express as px
+    
+    # Create pie chart
+    fig_pie = px.pie(
+        values=amounts, 
+        names=categories, 
+        title="Expenses by Category"
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    
+    # Create bar chart
+    fig_bar = px.bar(
+        x=categories, 
+        y=amounts, 
+        title="Category Spending",
+        labels={'x': 'Category', 'y': amount_label}
+    )
+    fig_bar.update_traces(marker_color='lightblue')
+    
+    return fig_pie, fig_bar
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_trend_charts(df_trends):
+    """Create the monthly spending trend and transaction count charts."""
+    import plotly.express as px
+    
+    # Spending trend chart
+    fig_trend = create_line_chart(
+        df_trends, 
+        x='Month', 
+        y='Total Expenses',
+        title='Monthly Spending Trend',
+        markers=True
+    )
+    fig_trend.update_traces(line_color='blue', marker_size=8)
+    
+    # Transaction count trend
+    fig_count = px.bar(
+        df_trends, 
+        x='Month', 
+        y='Number of Transactions',
+        title='Monthly Transaction Count',
+        color='Number of Transactions'
+    )
+    
+    return fig_trend, fig_count
+
+@st.fragment
+def _expense_history_fragment(user_id):
+    """Render the expense history tab; filter changes only rerun this fragment."""
+    import plotly.express as px
+    
+    st.subheader("📋 Expense History")
+    
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        days_filter = st.selectbox("Time Period", [7, 30, 90, 365], index=1)
+    
+    with col2:
+        category_filter = st.selectbox(
+            "Category Filter", 
+            ("All",) + _EXPENSE_CATEGORY_VALUES,
+            format_func=lambda x: _EXPENSE_CATEGORY_LABELS.get(x, x)
+        )
+    
+    with col3:
+        limit = st.number_input("Number of Records", min_value=1, max_value=100, value=20)
+    
+    # Get filtered expenses
+    start_date = date.today() - timedelta(days=days_filter)
+    category_enum = ExpenseCategory(category_filter) if category_filter != "All" else None
+    
+    expenses = _filtered_expenses(user_id, start_date, category_enum, limit)
+    
+    if expenses:
+        # Expenses table
+        df = pd.DataFrame.from_records(
+            (
+                (e.expense_date, float(e.amount), e.description, e.category.value.title())
+                for e in expenses
+            ),
+            columns=['Date', 'Amount', 'Description', 'Category']
+        )
+        
+        # Summary metrics over the whole filtered period, aggregated in SQL
+        expense_summary = _expense_summary(user_id, start_date, category_enum)
+        total_amount = sum(total for total, _ in expense_summary.values())
+        expense_count = sum(count for _, count in expense_summary.values())
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Total Amount", format_currency(total_amount))
+        with col2:
+            st.metric("Number of Expenses", expense_count)
+        with col3:
+            st.metric("Average Amount", format_currency(total_amount / expense_count if expense_count else Decimal('0')))
+        
+        # Display as interactive table
+        currency_format = f"{currency_code}%.2f"
+        
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Amount": st.column_config.NumberColumn(
+                    "Amount",
+                    format=currency_format
+                ),
+                "Date": st.column_config.DateColumn(
+                    "Date",
+                    format="YYYY-MM-DD"
+                )
+            }
+        )
+        if expense_count > len(df):
+            st.caption(f"Showing the {len(df)} most recent of {expense_count} expenses. Use the CSV export in Settings for the full history.")
+        
+        # Category breakdown for filtered data
+        if expense_count > 1:
+            category_totals = np.fromiter(
+                (float(total) for total, _ in expense_summary.values()),
+                dtype=np.float64,
+                count=len(expense_summary)
+            )
+            
+            # Update chart label with user's currency
+            amount_label = f"Amount ({currency_code})"
+            
+            fig = px.bar(
+                x=[category.value.title() for category in expense_summary],
+                y=category_totals,
+                title=f"Spending by Category (Last {days_filter} days)",
+                labels={'x': 'Category', 'y': amount_label}
+            )
+            st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
+    
+    else:
+        st.info("No expenses found for the selected criteria.")
+
+@st.fragment
+def _monthly_report_fragment(user_id):
+    """Render the monthly report tab; month changes only rerun this fragment."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    st.subheader("📊 Monthly Budget Report")
+    
+    # Month selector
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        selected_month = st.selectbox(
+            "Select Month",
+            options=_MONTH_OPTIONS,
+            index=_CURRENT_MONTH_INDEX
+        )
+    
+    try:
+        month_date = datetime.strptime(selected_month, "%Y-%m").date()
+        summary = _summary(user_id, month_date)
+        
+        if summary:
+            # Metrics format the summary's Decimals; the charts get floats
+            income, expenses, savings, target = map(float, (
+                summary.total_income, summary.total_expenses,
+                summary.actual_savings, summary.savings_target
+            ))
+            
+            # Key metrics
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("💵 Income", format_currency(summary.total_income))
+            with col2:
+                st.metric("💸 Expenses", format_currency(summary.total_expenses))
+            with col3:
+                st.metric("💰 Savings", format_currency(summary.actual_savings))
+            with col4:
+                savings_rate = (savings / income * 100) if income > 0 else 0
+                st.metric("📊 Savings Rate", f"{savings_rate:.1f}%")
+            
+            # Visual breakdown
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Income vs Expenses vs Savings
+                fig = go.Figure(data=[
+                    go.Bar(name='Income', x=['Financial Summary'], y=[income], marker_color='green'),
+                    go.Bar(name='Expenses', x=['Financial Summary'], y=[expenses], marker_color='red'),
+                    go.Bar(name='Savings', x=['Financial Summary'], y=[savings], marker_color='blue')
+                ])
+                fig.update_layout(title="Income vs Expenses vs Savings", barmode='group')
+                st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
+            
+            with col2:
+                # Goal vs Actual
+                goal_vs_actual = create_goal_gauge(savings, target)
+                st.plotly_chart(goal_vs_actual, use_container_width=True, config=_STATIC_CHART_CONFIG)
+            
+            # Category breakdown
+            if summary.expense_by_category:
+                st.subheader("💳 Expense Categories")
+                
+                categories = list(summary.expense_by_category.keys())
+                amounts = np.fromiter(summary.expense_by_category.values(), dtype=np.float64, count=len(categories))
+                
+                # Create DataFrame for better display
+                category_df = pd.DataFrame({
+                    'Category': [cat.title() for cat in categories],
+                    'Amount': amounts,
+                    'Percentage': amounts * (100.0 / amounts.sum())
+                })
+                
+                col1, col2 = st.columns([1, 1])
+                
+                with col1:
+                    st.dataframe(
+                        category_df,
+                        column_config={
+                            "Amount": st.column_config.NumberColumn("Amount", format="$%.2f"),
+                            "Percentage": st.column_config.NumberColumn("Percentage", format="%.1f%%")
+                        },
+                        use_container_width=True
+                    )
+                
+                with col2:
+                    fig_donut = px.pie(
+                        values=amounts,
+                        names=[cat.title() for cat in categories],
+                        title="Category Distribution",
+                        hole=0.4
+                    )
+                    st.plotly_chart(fig_donut, use_container_width=True, config=_STATIC_CHART_CONFIG)
+        
+        else:
+            st.warning(f"No data available for {month_date.strftime('%B %Y')}")
+            
+    except Exception as e:
+        st.error(f"Error generating report: {str(e)}")
+
+@st.fragment
+def _data_management_fragment(user_id):
+    """Render the Settings data management tab; its widgets only rerun this fragment."""
+    st.subheader("🗃️ Data Management & Backup")
+    
+    # Backup Section
+    st.markdown("### 💾 Backup & Restore System")
+    st.info("📋 Protect your data from being lost during deployments by creating backups stored in the repository.")
+    
+    try:
+        from backup_system import BackupRestoreSystem
+        backup_system = BackupRestoreSystem()
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**📤 Create Backup**")
+            custom_filename = st.text_input("Backup filename (optional)", placeholder="my_backup.json", key="backup_filename")
+            
+            if st.button("🗄️ Create Backup", type="primary", use_container_width=True):
+                try:
+                    filename = custom_filename if custom_filename else None
+                    backup_path = backup_system.create_backup(filename)
+                    st.success(f"✅ Backup created successfully!")
+                    st.info(f"📁 Backup saved to: {backup_path}")
+                except Exception as e:
+                    st.error(f"❌ Error creating backup: {str(e)}")
+            
+            # Show backup info
+            try:
+                backup_info = backup_system.get_backup_info()
+                if backup_info["latest_backup_exists"]:
+                    st.success("✅ Latest backup available for auto-restore")
+                else:
+                    st.warning("⚠️ No backup available - create one for protection")
+            except Exception:
+                pass
+        
+        with col2:
+            st.write("**📥 Restore Backup**")
+            
+            # List available backups
+            try:
+                backup_info = backup_system.get_backup_info()
+                if backup_info["available_backups"]:
+                    backup_options = ["Latest backup"] + [b["filename"] for b in backup_info["available_backups"]]
+                    selected_backup = st.selectbox("Select backup to restore", backup_options, key="restore_backup")
+                    
+                    st.warning("⚠️ This will overwrite existing data! Make sure to create a backup first.")
+                    
+                    if st.button("🔄 Restore Backup", type="secondary", use_container_width=True):
+                        try:
+                            backup_file = None if selected_backup == "Latest backup" else selected_backup
+                            success = backup_system.restore_from_backup(backup_file)
+                            if success:
+                                _clear_cached_reads()
+                                st.success("✅ Backup restored successfully!")
+                                st.info("🔄 Please refresh the page to see restored data.")
+                            else:
+                                st.error("❌ Failed to restore backup")
+                        except Exception as e:
+                            st.error(f"❌ Error restoring backup: {str(e)}")
+                else:
+                    st.info("📂 No backups available")
+            except Exception as e:
+                st.warning(f"⚠️ Cannot load backup list: {str(e)}")
+        
+        # Auto-restore status
+        st.markdown("### 🔄 Auto-Restore Status")
+        try:
+            should_restore = backup_system.should_restore_on_startup()
+            if should_restore:
+                st.warning("⚠️ Database appears empty - auto-restore will activate on next deployment")
+            else:
+                st.success("✅ Database has sufficient data - auto-restore not needed")
+        except Exception:
+            st.info("ℹ️ Cannot check auto-restore status")
+            
+    except ImportError:
+        st.error("❌ Backup system not available")
+    except Exception as e:
+        st.error(f"❌ Backup system error: {str(e)}")
+    
+    st.markdown("---")
+    
+    # Export Section
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.write("**📤 Export Data**")
+        # The CSV is only built when the download is actually requested
+        st.download_button(
+            label="📤 Export Expenses to CSV",
+            data=functools.partial(_build_expenses_csv, services['expense'], user_id),
+            file_name=f"expenses_{date.today().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    with col2:
+        st.write("**📊 Database Info**")
+        
+        # Show database statistics, queried only when asked for
+        if st.button("📊 Show Database Statistics", use_container_width=True):
+            try:
+                total_expenses, total_income_entries, total_goals = _data_counts(user_id)
+                
+                st.info(f"""
+                📊 **Database Statistics:**
+                - Total Expenses: {total_expenses}
+                - Income Entries: {total_income_entries}
+                - Savings Goals: {total_goals}
+                """)
+                
+            except Exception as e:
+                st.error(f"Error loading database info: {str(e)}")
+    
+    with col3:
+        st.write("**🔄 Reset Database**")
+        
+        # Warning message
+        st.warning("""
+        ⚠️ **Danger Zone**
+        
+        This will permanently delete ALL your data:
+        - Income entries
+        - Expense records  
+        - Savings goals
+        - All historical data
+        """)
+        
+        # Confirmation checkboxes
+        confirm_reset = st.checkbox(
+            "I understand this will delete all my data",
+            key="confirm_reset_checkbox"
+        )
+        
+        double_confirm = st.checkbox(
+            "I am absolutely sure I want to proceed",
+            key="double_confirm_checkbox",
+            disabled=not confirm_reset
+        )
+        
+        # Reset button (only enabled when both confirmations are checked)
+        reset_enabled = confirm_reset and double_confirm
+        
+        if st.button(
+            "🗑️ RESET DATABASE", 
+            disabled=not reset_enabled,
+            type="primary" if reset_enabled else "secondary",
+            help="This action cannot be undone!"
+        ):
+            if reset_enabled:
+                try:
+                    # Delete all data; this signs out and reruns to the login form,
+                    # since the current account no longer exists
+                    _reset_database()
+                except Exception as e:
+                    st.error(f"❌ Error resetting database: {str(e)}")
+                    st.error("You can also reset manually by running: `python reset_database.py`")
+            else:
+                st.error("⚠️ Please complete both confirmation steps before proceeding.")
+        
+        if not reset_enabled:
+            if not confirm_reset:
+                st.caption("✓ Check both boxes above to enable the reset button")
+            elif not double_confirm:
+                st.caption("✓ Please check the second confirmation box")
+
+@st.fragment
+def _preferences_fragment():
+    """Render the Settings preferences tab; its widgets only rerun this fragment."""
+    st.subheader("📊 Application Preferences")
+    
+    # Database connection info
+    try:
+        db_info = services['auth'].db_manager.get_connection_info()
+        
+        st.write("**Database Configuration**")
+        
+        if db_info['is_persistent']:
+            st.success(f"✅ **{db_info['database_type']}** - Persistent Storage Enabled")
+            st.caption("Your data will persist across deployments!")
+        else:
+            st.info(f"📱 **{db_info['database_type']}** - Multi-User Ready")
+            st.caption("Perfect for development and testing. Data is isolated per user session.")
+            
+            # Show cloud deployment note
+            with st.expander("☁️ For Production Deployment (Optional)"):
+                st.markdown("""
+                ### Free PostgreSQL Options for Cloud Persistence:
+                
+                **Option 1: Supabase (Free tier - 500MB)**
+                1. Go to [supabase.com](https://supabase.com) and create account
+                2. Create new project → Get PostgreSQL URL
+                3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
+                
+                **Option 2: Neon (Free tier - 3GB)**
+                1. Go to [neon.tech](https://neon.tech) and create account  
+                2. Create database → Get connection string
+                3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
+                
+                **Option 3: ElephantSQL (Free tier - 20MB)**
+                1. Go to [elephantsql.com](https://elephantsql.com)
+                2. Create "Tiny Turtle" free instance
+                3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
+                
+                **Benefits of PostgreSQL:**
+                - ✅ Data persists across deployments
+                - ✅ Better performance for many users
+                - ✅ Advanced database features
+                - ✅ Automatic backups
+                
+                **Current SQLite is great for:**
+                - ✅ Development and testing
+                - ✅ Small to medium user base
+                - ✅ No external dependencies
+                - ✅ Fast and reliable
+                """)
+        
+        # Test database connection
+        if _connection_ok():
+            st.success("🔗 Database connection: OK")
+            
+            # Show multi-user statistics; like the Multi-User overview, admin only
+            if user.is_admin:
+                try:
+                    stats = _system_stats()
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("👥 Users", stats['total_users'])
+                    with col2:
+                        st.metric("💰 Income Entries", stats['total_income_entries'])
+                    with col3:
+                        st.metric("💸 Expenses", stats['total_expenses'])
+                    with col4:
+                        st.metric("🎯 Goals", stats['total_savings_goals'])
+                        
+                except Exception:
+                    pass
+        else:
+            st.error("❌ Database connection: Failed")
+            
+    except Exception as e:
+        st.error(f"Error checking database: {str(e)}")
+    
+    st.divider()
+    
+    # Currency, formatting and budget preferences are applied together from one form
+    current_currency = prefs.get_currency()
+    current_decimal_places = prefs.get_decimal_places()
+    current_group_thousands = prefs.get_group_thousands()
+    current_target_day = prefs.get_savings_target_day()
+    
+    with st.form("preferences_form"):
+        # Currency selection
+        st.write("**Currency Settings**")
+        
+        selected_currency = st.selectbox(
+            "Currency Display",
+            _CURRENCIES,
+            index=_CURRENCY_INDEX.get(current_currency, 0),
+            format_func=lambda currency: currency.label,
+            help="Select your preferred currency for display"
+        )
+        
+        # Display formatting options
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Decimal places
+            decimal_places = st.slider(
+                "Decimal Places",
+                min_value=0,
+                max_value=4,
+                value=current_decimal_places,
+                help="Number of decimal places to show in currency amounts"
+            )
+        
+        with col2:
+            # Thousands separator
+            group_thousands = st.checkbox(
+                "Use Thousands Separator",
+                value=current_group_thousands,
+                help="Show commas in large numbers (e.g., 1,000.00)"
+            )
+        
+        st.divider()
+        
+        # Other preferences
+        st.write("**Budget Settings**")
+        
+        # Target date preference
+        target_day = st.slider(
+            "Savings Target Day of Month", 
+            min_value=1, 
+            max_value=28, 
+            value=current_target_day,
+            help="Day of the month by which you want to achieve your savings goal"
+        )
+        
+        submitted = st.form_submit_button("💾 Apply Preferences", use_container_width=True)
+    
+    # Only the changed setters run, followed by a single rerun
+    if submitted:
+        changed = False
+        
+        if selected_currency != current_currency:
+            prefs.set_currency(selected_currency)
+            changed = True
+        
+        if decimal_places != current_decimal_places:
+            prefs.set_decimal_places(decimal_places)
+            changed = True
+        
+        if group_thousands != current_group_thousands:
+            prefs.set_group_thousands(group_thousands)
+            changed = True
+        
+        if target_day != current_target_day:
+            prefs.set_savings_target_day(target_day)
+            changed = True
+        
+        if changed:
+            st.toast("✅ Preferences updated")
+            st.rerun()
+    
+    # Preview
+    st.write("**Preview:**")
+    formatted_preview = Formatters.format_currency(_SAMPLE_AMOUNT)
+    st.code(f"Sample amount: {formatted_preview}")
+    
+    st.divider()
+    
+    # Future features section
+    st.write("**Coming Soon**")
+    
+    # Theme preference (placeholder for future feature)
+    st.selectbox(
+        "Color Theme",
+        ["Default", "Dark", "Light"],
+        disabled=True,
+        help="Theme selection (coming soon)"
+    )
+    
+    # Reset preferences
+    st.write("**Reset Preferences**")
+    if st.button("🔄 Reset All Preferences to Defaults"):
+        prefs.reset_to_defaults()
+        st.success("✅ All preferences reset to defaults")
+        st.rerun()
+
 # Dashboard Page
 if page == f"📊 {t('dashboard')}":
     st.header(f"📊 {t('budget_dashboard')}")
@@ -237,40 +1013,41 @@ if page == f"📊 {t('dashboard')}":
     
     try:
         # Get recommendation and summary
-        recommendation = services['recommendation'].get_daily_recommendation(user_id)
-        summary = services['recommendation'].get_monthly_summary(user_id)
-        alerts = services['recommendation'].get_smart_alerts(user_id)
-        progress = services['recommendation'].get_savings_progress(user_id)
+        recommendation, summary, alerts, progress, recent_expenses = _dashboard_bundle(user_id, today)
         
         if summary:
+            # Decimals from the summary go straight to format_currency
+            income, expenses = summary.total_income, summary.total_expenses
+            savings, target = summary.actual_savings, summary.savings_target
+            
             # Main metrics
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 st.metric(
                     label=f"💵 {t('monthly_income')}", 
-                    value=format_currency(float(summary.total_income)),
+                    value=format_currency(income),
                     delta=None
                 )
             
             with col2:
                 st.metric(
                     label=f"💸 {t('total_expenses')}", 
-                    value=format_currency(float(summary.total_expenses)),
-                    delta=f"-{format_currency(float(summary.total_expenses))}"
+                    value=format_currency(expenses),
+                    delta=f"-{format_currency(expenses)}"
                 )
             
             with col3:
                 st.metric(
                     label=f"💰 {t('current_savings')}", 
-                    value=format_currency(float(summary.actual_savings)),
-                    delta=f"+{format_currency(float(summary.actual_savings))}"
+                    value=format_currency(savings),
+                    delta=f"+{format_currency(savings)}"
                 )
             
             with col4:
                 st.metric(
                     label=f"🎯 {t('savings_target')}", 
-                    value=format_currency(float(summary.savings_target)),
+                    value=format_currency(target),
                     delta=None
                 )
             
@@ -282,24 +1059,24 @@ if page == f"📊 {t('dashboard')}":
                 
                 with col1:
                     st.info(f"""
-                    **Daily Spending Limit:** {format_currency(float(recommendation.recommended_daily_limit))}
+                    **Daily Spending Limit:** {format_currency(recommendation.recommended_daily_limit)}
                     
                     📅 **Days Remaining:** {recommendation.days_remaining}
                     
-                    💸 **Spent This Month:** {format_currency(float(recommendation.current_month_spent))}
+                    💸 **Spent This Month:** {format_currency(recommendation.current_month_spent)}
                     
-                    📊 **Projected Savings:** {format_currency(float(recommendation.projected_savings))}
+                    📊 **Projected Savings:** {format_currency(recommendation.projected_savings)}
                     """)
                 
                 with col2:
-                    # Progress gauge
+                    # Progress bar; the percentage text is not capped at 100%
                     if progress:
-                        fig = create_progress_bar(
-                            float(progress['current_savings']), 
-                            float(progress['target_amount']), 
-                            "Savings Progress"
+                        target_amount = progress['target_amount']
+                        percentage = progress['current_savings'] / target_amount * 100 if target_amount > 0 else 0
+                        st.progress(
+                            min(max(percentage / 100, 0.0), 1.0),
+                            text=f"Savings Progress: {percentage:.0f}%"
                         )
-                        st.plotly_chart(fig, use_container_width=True)
             
             # Alerts section
             if alerts:
@@ -323,50 +1100,27 @@ if page == f"📊 {t('dashboard')}":
                 
                 # Prepare data for chart
                 categories = list(summary.expense_by_category.keys())
-                amounts = [float(amount) for amount in summary.expense_by_category.values()]
+                amounts = np.fromiter(summary.expense_by_category.values(), dtype=np.float64, count=len(categories))
                 
-                # Create pie chart
-                fig_pie = px.pie(
-                    values=amounts, 
-                    names=categories, 
-                    title="Expenses by Category"
-                )
-                fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-                
-                # Create bar chart
-                prefs = get_user_preferences()
-                currency_code = prefs.get_currency_code()
-                chart_amount_label = f"Amount ({currency_code})"
-                
-                fig_bar = px.bar(
-                    x=categories, 
-                    y=amounts, 
-                    title="Category Spending",
-                    labels={'x': 'Category', 'y': chart_amount_label}
-                )
-                fig_bar.update_traces(marker_color='lightblue')
+                fig_pie, fig_bar = create_category_charts(categories, amounts, f"Amount ({currency_code})")
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.plotly_chart(fig_pie, use_container_width=True)
+                    st.plotly_chart(fig_pie, use_container_width=True, config=_STATIC_CHART_CONFIG)
                 with col2:
-                    st.plotly_chart(fig_bar, use_container_width=True)
+                    st.plotly_chart(fig_bar, use_container_width=True, config=_CHART_CONFIG)
             
             # Recent expenses
-            recent_expenses = services['expense'].get_expenses(user_id, limit=5)
             if recent_expenses:
                 st.subheader("💳 Recent Expenses")
                 
-                expense_data = []
-                for expense in recent_expenses:
-                    expense_data.append({
-                        'Date': expense.expense_date.strftime('%Y-%m-%d'),
-                        'Amount': float(expense.amount),
-                        'Description': expense.description,
-                        'Category': expense.category.value.title()
-                    })
-                
-                df = pd.DataFrame(expense_data)
+                df = pd.DataFrame.from_records(
+                    (
+                        (e.expense_date.strftime('%Y-%m-%d'), float(e.amount), e.description, e.category.value.title())
+                        for e in recent_expenses
+                    ),
+                    columns=['Date', 'Amount', 'Description', 'Category']
+                )
                 st.dataframe(df, use_container_width=True)
         
         else:
@@ -400,15 +1154,13 @@ elif page == "💰 Income & Goals":
         with col1:
             # Income form
             with st.form("income_form"):
-                # Get user preferences for currency
-                prefs = get_user_preferences()
                 currency_label = Formatters.format_currency_input_label("Monthly Income")
                 amount = st.number_input(currency_label, min_value=0.01, step=0.01, format="%.2f")
                 description = st.text_input("Description (optional)", placeholder="e.g., Main salary")
                 month_str = st.selectbox(
                     "Month", 
-                    options=[f"{datetime.now().year}-{i:02d}" for i in range(1, 13)],
-                    index=datetime.now().month - 1
+                    options=_MONTH_OPTIONS,
+                    index=_CURRENT_MONTH_INDEX
                 )
                 
                 if st.form_submit_button("💰 Set Income", use_container_width=True):
@@ -420,7 +1172,8 @@ elif page == "💰 Income & Goals":
                             month=month_date,
                             description=description if description else None
                         )
-                        st.success(f"✅ Income set: {format_currency(float(entry.amount))} for {month_date.strftime('%B %Y')}")
+                        _clear_cached_reads()
+                        st.success(f"✅ Income set: {format_currency(entry.amount)} for {month_date.strftime('%B %Y')}")
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error setting income: {str(e)}")
@@ -430,7 +1183,7 @@ elif page == "💰 Income & Goals":
             current_income = services['budget'].get_monthly_income(user_id, date.today())
             st.metric(
                 "Current Month Income", 
-                format_currency(float(current_income))
+                format_currency(current_income)
             )
             
             # Income history
@@ -438,7 +1191,7 @@ elif page == "💰 Income & Goals":
             if income_entries:
                 st.write("**Recent Entries:**")
                 for entry in income_entries[-3:]:
-                    st.write(f"• {format_currency(float(entry.amount))} - {entry.month.strftime('%b %Y')}")
+                    st.write(f"• {format_currency(entry.amount)} - {entry.month.strftime('%b %Y')}")
     
     with tab2:
         st.subheader("🎯 Set Savings Goals")
@@ -453,8 +1206,8 @@ elif page == "💰 Income & Goals":
                 description = st.text_input("Goal Description (optional)", placeholder="e.g., Emergency fund")
                 month_str = st.selectbox(
                     "Target Month", 
-                    options=[f"{datetime.now().year}-{i:02d}" for i in range(1, 13)],
-                    index=datetime.now().month - 1,
+                    options=_MONTH_OPTIONS,
+                    index=_CURRENT_MONTH_INDEX,
                     key="goal_month"
                 )
                 
@@ -467,7 +1220,8 @@ elif page == "💰 Income & Goals":
                             month=month_date,
                             description=description if description else None
                         )
-                        st.success(f"✅ Savings goal set: {format_currency(float(goal.target_amount))} for {month_date.strftime('%B %Y')}")
+                        _clear_cached_reads()
+                        st.success(f"✅ Savings goal set: {format_currency(goal.target_amount)} for {month_date.strftime('%B %Y')}")
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error setting goal: {str(e)}")
@@ -478,7 +1232,7 @@ elif page == "💰 Income & Goals":
             if current_goal:
                 st.metric(
                     "Current Month Goal", 
-                    format_currency(float(current_goal.target_amount))
+                    format_currency(current_goal.target_amount)
                 )
                 if current_goal.description:
                     st.write(f"**Description:** {current_goal.description}")
@@ -505,8 +1259,8 @@ elif page == "💸 Expenses":
                 description = st.text_input("Description", placeholder="e.g., Lunch at restaurant")
                 category = st.selectbox(
                     "Category", 
-                    options=[cat.value for cat in ExpenseCategory],
-                    format_func=lambda x: x.title()
+                    options=_EXPENSE_CATEGORY_VALUES,
+                    format_func=_EXPENSE_CATEGORY_LABELS.__getitem__
                 )
                 expense_date = st.date_input("Date", value=date.today())
                 
@@ -519,126 +1273,36 @@ elif page == "💸 Expenses":
                             category=ExpenseCategory(category),
                             expense_date=expense_date
                         )
-                        st.success(f"✅ Expense added: {format_currency(float(expense.amount))} - {expense.description}")
+                        _clear_cached_reads()
+                        st.success(f"✅ Expense added: {format_currency(expense.amount)} - {expense.description}")
                         
                         # Show updated daily limit
-                        recommendation = services['recommendation'].get_daily_recommendation(user_id)
+                        recommendation = _daily_recommendation(user_id, date.today())
                         if recommendation:
-                            st.info(f"💡 Updated daily limit: {format_currency(float(recommendation.recommended_daily_limit))}")
+                            st.info(f"💡 Updated daily limit: {format_currency(recommendation.recommended_daily_limit)}")
                         
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Error adding expense: {str(e)}")
-        
-        with col2:
-            # Today's expenses
-            today_expenses = services['expense'].get_today_expenses(user_id)
-            today_total = sum(float(exp.amount) for exp in today_expenses)
-            
-            st.metric("Today's Spending", format_currency(today_total))
-            
-            if today_expenses:
-                st.write("**Today's Expenses:**")
-                for expense in today_expenses:
-                    st.write(f"• {format_currency(float(expense.amount))} - {expense.description}")
-    
-    with tab2:
-        st.subheader("📋 Expense History")
-        
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            days_filter = st.selectbox("Time Period", [7, 30, 90, 365], index=1)
-        
-        with col2:
-            category_filter = st.selectbox(
-                "Category Filter", 
-                ["All"] + [cat.value for cat in ExpenseCategory],
-                format_func=lambda x: x.title() if x != "All" else x
-            )
-        
-        with col3:
-            limit = st.number_input("Number of Records", min_value=1, max_value=100, value=20)
-        
-        # Get filtered expenses
-        start_date = date.today() - timedelta(days=days_filter)
-        category_enum = ExpenseCategory(category_filter) if category_filter != "All" else None
-        
-        expenses = services['expense'].get_expenses(
-            user_id=user_id,
-            start_date=start_date,
-            category=category_enum,
-            limit=limit
-        )
-        
-        if expenses:
-            # Summary metrics
-            total_amount = sum(float(exp.amount) for exp in expenses)
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Total Amount", format_currency(total_amount))
-            with col2:
-                st.metric("Number of Expenses", len(expenses))
-            with col3:
-                avg_amount = total_amount / len(expenses) if expenses else 0
-                st.metric("Average Amount", format_currency(avg_amount))
-            
-            # Expenses table
-            expense_data = []
-            for expense in expenses:
-                expense_data.append({
-                    'Date': expense.expense_date,
-                    'Amount': float(expense.amount),
-                    'Description': expense.description,
-                    'Category': expense.category.value.title()
-                })
-            
-            df = pd.DataFrame(expense_data)
-            
-            # Display as interactive table
-            prefs = get_user_preferences()
-            currency_code = prefs.get_currency_code()
-            currency_format = f"{currency_code}%.2f"
+        
+        with col2:
+            # Today's expenses
+            today_total = _today_total(user_id, date.today())
             
-            st.dataframe(
-                df,
-                use_container_width=True,
-                column_config={
-                    "Amount": st.column_config.NumberColumn(
-                        "Amount",
-                        format=currency_format
-                    ),
-                    "Date": st.column_config.DateColumn(
-                        "Date",
-                        format="YYYY-MM-DD"
-                    )
-                }
-            )
+            st.metric("Today's Spending", format_currency(today_total))
             
-            # Category breakdown for filtered data
-            if len(expenses) > 1:
-                category_totals = {}
-                for expense in expenses:
-                    cat = expense.category.value.title()
-                    category_totals[cat] = category_totals.get(cat, 0) + float(expense.amount)
-                
-                # Update chart label with user's currency
-                prefs = get_user_preferences()
-                currency_code = prefs.get_currency_code()
-                amount_label = f"Amount ({currency_code})"
-                
-                fig = px.bar(
-                    x=list(category_totals.keys()),
-                    y=list(category_totals.values()),
-                    title=f"Spending by Category (Last {days_filter} days)",
-                    labels={'x': 'Category', 'y': amount_label}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        else:
-            st.info("No expenses found for the selected criteria.")
+            if today_total > 0:
+                today_expenses = _today_expenses(user_id, date.today())
+                st.write("**Today's Expenses:**")
+                for expense in today_expenses[:10]:
+                    st.write(f"• {format_currency(expense.amount)} - {expense.description}")
+                if len(today_expenses) > 10:
+                    with st.expander(f"Show {len(today_expenses) - 10} more"):
+                        for expense in today_expenses[10:]:
+                            st.write(f"• {format_currency(expense.amount)} - {expense.description}")
+    
+    with tab2:
+        _expense_history_fragment(user_id)
 
 # Reports Page
 elif page == "📈 Reports":
@@ -647,158 +1311,40 @@ elif page == "📈 Reports":
     tab1, tab2, tab3 = st.tabs(["📊 Monthly Report", "📈 Trends", "🎯 Goals Analysis"])
     
     with tab1:
-        st.subheader("📊 Monthly Budget Report")
-        
-        # Month selector
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            selected_month = st.selectbox(
-                "Select Month",
-                options=[f"{datetime.now().year}-{i:02d}" for i in range(1, 13)],
-                index=datetime.now().month - 1
-            )
-        
-        try:
-            month_date = datetime.strptime(selected_month, "%Y-%m").date()
-            summary = services['recommendation'].get_monthly_summary(user_id, month_date)
-            
-            if summary:
-                # Key metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("💵 Income", format_currency(float(summary.total_income)))
-                with col2:
-                    st.metric("💸 Expenses", format_currency(float(summary.total_expenses)))
-                with col3:
-                    st.metric("💰 Savings", format_currency(float(summary.actual_savings)))
-                with col4:
-                    savings_rate = (float(summary.actual_savings) / float(summary.total_income) * 100) if summary.total_income > 0 else 0
-                    st.metric("📊 Savings Rate", f"{savings_rate:.1f}%")
-                
-                # Visual breakdown
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Income vs Expenses vs Savings
-                    fig = go.Figure(data=[
-                        go.Bar(name='Income', x=['Financial Summary'], y=[float(summary.total_income)], marker_color='green'),
-                        go.Bar(name='Expenses', x=['Financial Summary'], y=[float(summary.total_expenses)], marker_color='red'),
-                        go.Bar(name='Savings', x=['Financial Summary'], y=[float(summary.actual_savings)], marker_color='blue')
-                    ])
-                    fig.update_layout(title="Income vs Expenses vs Savings", barmode='group')
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Goal vs Actual
-                    goal_vs_actual = go.Figure(go.Indicator(
-                        mode = "number+gauge+delta",
-                        value = float(summary.actual_savings),
-                        domain = {'x': [0, 1], 'y': [0, 1]},
-                        title = {'text': "Savings Goal Achievement"},
-                        delta = {'reference': float(summary.savings_target)},
-                        gauge = {
-                            'axis': {'range': [None, float(summary.savings_target) * 1.5]},
-                            'bar': {'color': "darkblue"},
-                            'steps': [
-                                {'range': [0, float(summary.savings_target)], 'color': "lightgray"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "red", 'width': 4},
-                                'thickness': 0.75,
-                                'value': float(summary.savings_target)
-                            }
-                        }
-                    ))
-                    goal_vs_actual.update_layout(height=400)
-                    st.plotly_chart(goal_vs_actual, use_container_width=True)
-                
-                # Category breakdown
-                if summary.expense_by_category:
-                    st.subheader("💳 Expense Categories")
-                    
-                    categories = list(summary.expense_by_category.keys())
-                    amounts = [float(amount) for amount in summary.expense_by_category.values()]
-                    
-                    # Create DataFrame for better display
-                    category_df = pd.DataFrame({
-                        'Category': [cat.title() for cat in categories],
-                        'Amount': amounts,
-                        'Percentage': [amount/sum(amounts)*100 for amount in amounts]
-                    })
-                    
-                    col1, col2 = st.columns([1, 1])
-                    
-                    with col1:
-                        st.dataframe(
-                            category_df,
-                            column_config={
-                                "Amount": st.column_config.NumberColumn("Amount", format="$%.2f"),
-                                "Percentage": st.column_config.NumberColumn("Percentage", format="%.1f%%")
-                            },
-                            use_container_width=True
-                        )
-                    
-                    with col2:
-                        fig_donut = px.pie(
-                            values=amounts,
-                            names=[cat.title() for cat in categories],
-                            title="Category Distribution",
-                            hole=0.4
-                        )
-                        st.plotly_chart(fig_donut, use_container_width=True)
-            
-            else:
-                st.warning(f"No data available for {month_date.strftime('%B %Y')}")
-                
-        except Exception as e:
-            st.error(f"Error generating report: {str(e)}")
+        _monthly_report_fragment(user_id)
     
     with tab2:
         st.subheader("📈 Spending Trends")
         
-        # Get last 6 months of data
-        months_data = []
+        # Get last 6 months of data with a single grouped query
         current_date = date.today().replace(day=1)
+        month_dates = []
         
         for i in range(6):
-            month_date = current_date - timedelta(days=32*i)
-            month_date = month_date.replace(day=1)
-            
-            monthly_expenses = services['expense'].get_monthly_expenses(user_id, month_date)
-            total_expenses = sum(float(exp.amount) for exp in monthly_expenses)
-            
+            month_dates.append(current_date - relativedelta(months=i))
+        
+        month_dates.reverse()  # Show chronologically
+        
+        end_date = current_date.replace(day=calendar.monthrange(current_date.year, current_date.month)[1])
+        totals_by_month = {
+            row['month']: row for row in _monthly_totals(user_id, month_dates[0], end_date)
+        }
+        
+        months_data = []
+        for month_date in month_dates:
+            row = totals_by_month.get(month_date)
             months_data.append({
                 'Month': month_date.strftime('%Y-%m'),
-                'Total Expenses': total_expenses,
-                'Number of Transactions': len(monthly_expenses)
+                'Total Expenses': float(row['total']) if row else 0.0,
+                'Number of Transactions': row['count'] if row else 0
             })
         
-        months_data.reverse()  # Show chronologically
-        
         if any(data['Total Expenses'] > 0 for data in months_data):
             df_trends = pd.DataFrame(months_data)
             
-            # Spending trend chart
-            fig_trend = px.line(
-                df_trends, 
-                x='Month', 
-                y='Total Expenses',
-                title='Monthly Spending Trend',
-                markers=True
-            )
-            fig_trend.update_traces(line_color='blue', marker_size=8)
-            st.plotly_chart(fig_trend, use_container_width=True)
-            
-            # Transaction count trend
-            fig_count = px.bar(
-                df_trends, 
-                x='Month', 
-                y='Number of Transactions',
-                title='Monthly Transaction Count',
-                color='Number of Transactions'
-            )
-            st.plotly_chart(fig_count, use_container_width=True)
+            fig_trend, fig_count = create_trend_charts(df_trends)
+            st.plotly_chart(fig_trend, use_container_width=True, config=_CHART_CONFIG)
+            st.plotly_chart(fig_count, use_container_width=True, config=_CHART_CONFIG)
         
         else:
             st.info("Not enough data to show trends. Start adding expenses to see trends over time!")
@@ -807,41 +1353,26 @@ elif page == "📈 Reports":
         st.subheader("🎯 Goals Analysis")
         
         # Savings progress
-        progress = services['recommendation'].get_savings_progress(user_id)
+        progress = _progress(user_id, date.today())
         
         if progress:
+            percentage = float(progress['progress_percentage'])
+            days_passed = progress['days_passed']
+            days_remaining = progress['days_remaining']
+            
             col1, col2 = st.columns(2)
             
             with col1:
                 # Progress metrics
                 st.metric("Target Amount", format_currency(progress['target_amount']))
                 st.metric("Current Savings", format_currency(progress['current_savings']))
-                st.metric("Progress", f"{progress['progress_percentage']:.1f}%")
-                st.metric("Days Passed", f"{progress['days_passed']}/{progress['days_passed'] + progress['days_remaining']}")
+                st.metric("Progress", f"{percentage:.1f}%")
+                st.metric("Days Passed", f"{days_passed}/{days_passed + days_remaining}")
             
             with col2:
                 # Visual progress
-                fig_progress = go.Figure(go.Indicator(
-                    mode = "gauge+number",
-                    value = progress['progress_percentage'],
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': "Goal Achievement"},
-                    gauge = {
-                        'axis': {'range': [None, 150]},
-                        'bar': {'color': "darkgreen"},
-                        'steps': [
-                            {'range': [0, 50], 'color': "lightgray"},
-                            {'range': [50, 100], 'color': "gray"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 100
-                        }
-                    }
-                ))
-                fig_progress.update_layout(height=400)
-                st.plotly_chart(fig_progress, use_container_width=True)
+                fig_progress = create_achievement_gauge(percentage)
+                st.plotly_chart(fig_progress, use_container_width=True, config=_STATIC_CHART_CONFIG)
             
             # Goal achievement prediction
             if progress['on_track']:
@@ -850,10 +1381,8 @@ elif page == "📈 Reports":
                 st.warning("⚠️ You may need to adjust your spending to meet your goal.")
                 
                 # Calculate required daily savings
-                remaining_target = progress['target_amount'] - progress['current_savings']
-                days_remaining = progress['days_remaining']
-                
                 if days_remaining > 0:
+                    remaining_target = progress['target_amount'] - progress['current_savings']
                     required_daily = remaining_target / days_remaining
                     st.info(f"💡 To reach your goal, you need to save {format_currency(required_daily)} per day for the remaining {days_remaining} days.")
         
@@ -876,25 +1405,17 @@ elif page == "⚙️ Settings":
             st.write("**Generate Sample Income & Goals**")
             if st.button("💰 Add Sample Income", use_container_width=True):
                 try:
-                    from decimal import Decimal
-                    from datetime import date
-                    
-                    # Add sample income
-                    income = services['budget'].add_income(
-                        user_id=user_id,
-                        amount=Decimal("3000.00"),
-                        month=date.today(),
-                        description="Sample Monthly Salary"
-                    )
-                    
-                    # Add sample savings goal
-                    goal = services['budget'].set_savings_goal(
+                    # Add sample income and savings goal in one transaction
+                    services['budget'].add_income_and_goal(
                         user_id=user_id,
-                        target_amount=Decimal("600.00"),
+                        income_amount=Decimal("3000.00"),
+                        goal_amount=Decimal("600.00"),
                         month=date.today(),
-                        description="Sample Emergency Fund Goal"
+                        income_description="Sample Monthly Salary",
+                        goal_description="Sample Emergency Fund Goal"
                     )
                     
+                    _clear_cached_reads()
                     st.success("✅ Sample income and goal added!")
                     st.rerun()
                 except Exception as e:
@@ -903,42 +1424,31 @@ elif page == "⚙️ Settings":
             st.write("**Generate Sample Expenses**")
             if st.button("💸 Add Sample Expenses", use_container_width=True):
                 try:
-                    from decimal import Decimal
-                    from datetime import date, timedelta
-                    import random
-                    
                     # Sample expenses data
                     sample_expenses = [
-                        (50.00, "Groceries", "food"),
-                        (25.50, "Lunch", "food"),
-                        (200.00, "Electricity Bill", "utilities"),
-                        (45.75, "Gas Station", "transportation"),
-                        (30.00, "Movie Tickets", "entertainment"),
-                        (15.00, "Coffee", "food"),
-                        (80.00, "Phone Bill", "utilities"),
-                        (120.00, "Dinner Out", "food"),
-                        (60.00, "Uber Rides", "transportation"),
-                        (35.00, "Streaming Service", "entertainment")
+                        (Decimal("50.00"), "Groceries", ExpenseCategory.FOOD),
+                        (Decimal("25.50"), "Lunch", ExpenseCategory.FOOD),
+                        (Decimal("200.00"), "Electricity Bill", ExpenseCategory.UTILITIES),
+                        (Decimal("45.75"), "Gas Station", ExpenseCategory.TRANSPORTATION),
+                        (Decimal("30.00"), "Movie Tickets", ExpenseCategory.ENTERTAINMENT),
+                        (Decimal("15.00"), "Coffee", ExpenseCategory.FOOD),
+                        (Decimal("80.00"), "Phone Bill", ExpenseCategory.UTILITIES),
+                        (Decimal("120.00"), "Dinner Out", ExpenseCategory.FOOD),
+                        (Decimal("60.00"), "Uber Rides", ExpenseCategory.TRANSPORTATION),
+                        (Decimal("35.00"), "Streaming Service", ExpenseCategory.ENTERTAINMENT)
                     ]
                     
-                    added_count = 0
-                    for amount, desc, category in sample_expenses:
-                        try:
-                            # Add expenses over the last 10 days
-                            days_ago = random.randint(0, 10)
-                            expense_date = date.today() - timedelta(days=days_ago)
-                            
-                            services['expense'].add_expense(
-                                user_id=user_id,
-                                amount=Decimal(str(amount)),
-                                description=desc,
-                                category=ExpenseCategory(category),
-                                expense_date=expense_date
-                            )
-                            added_count += 1
-                        except Exception:
-                            continue
+                    # Spread the expenses over the last 10 days and insert them in one transaction
+                    today = date.today()
+                    added_count = services['expense'].add_expenses(
+                        user_id,
+                        [
+                            (amount, desc, category, today - timedelta(days=random.randint(0, 10)))
+                            for amount, desc, category in sample_expenses
+                        ]
+                    )
                     
+                    _clear_cached_reads()
                     st.success(f"✅ Added {added_count} sample expenses!")
                     st.rerun()
                 except Exception as e:
@@ -963,28 +1473,9 @@ elif page == "⚙️ Settings":
             st.write("**Quick Reset**")
             if st.button("🔄 Clear All Demo Data", use_container_width=True):
                 try:
-                    # This would be the same as the full database reset
-                    from pathlib import Path
-                    import os
-                    from budget_manager.core.database import DatabaseManager
-                    
-                    # Get database path
-                    try:
-                        if os.environ.get('STREAMLIT_CLOUD_DEPLOYMENT'):
-                            data_dir = Path("./data")
-                        else:
-                            data_dir = Path.home() / ".budget_manager"
-                        db_path = data_dir / "budget.db"
-                    except (PermissionError, OSError):
-                        data_dir = Path("./data")
-                        db_path = data_dir / "budget.db"
-                    
-                    # Delete and recreate database
-                    if db_path.exists():
-                        os.remove(db_path)
-                    
-                    DatabaseManager()
-                    st.cache_resource.clear()
+                    # Remove only this user's income, goals and expenses
+                    services['expense'].db_manager.clear_user_data(user_id)
+                    _clear_cached_reads()
                     
                     st.success("✅ Demo data cleared!")
                     st.rerun()
@@ -992,469 +1483,62 @@ elif page == "⚙️ Settings":
                     st.error(f"❌ Error clearing data: {str(e)}")
     
     with tab1:
-        st.subheader("🗃️ Data Management & Backup")
-        
-        # Backup Section
-        st.markdown("### 💾 Backup & Restore System")
-        st.info("📋 Protect your data from being lost during deployments by creating backups stored in the repository.")
-        
-        try:
-            from backup_system import BackupRestoreSystem
-            backup_system = BackupRestoreSystem()
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**📤 Create Backup**")
-                custom_filename = st.text_input("Backup filename (optional)", placeholder="my_backup.json", key="backup_filename")
-                
-                if st.button("🗄️ Create Backup", type="primary", use_container_width=True):
-                    try:
-                        filename = custom_filename if custom_filename else None
-                        backup_path = backup_system.create_backup(filename)
-                        st.success(f"✅ Backup created successfully!")
-                        st.info(f"📁 Backup saved to: {backup_path}")
-                    except Exception as e:
-                        st.error(f"❌ Error creating backup: {str(e)}")
-                
-                # Show backup info
-                try:
-                    backup_info = backup_system.get_backup_info()
-                    if backup_info["latest_backup_exists"]:
-                        st.success("✅ Latest backup available for auto-restore")
-                    else:
-                        st.warning("⚠️ No backup available - create one for protection")
-                except Exception:
-                    pass
-            
-            with col2:
-                st.write("**📥 Restore Backup**")
-                
-                # List available backups
-                try:
-                    backup_info = backup_system.get_backup_info()
-                    if backup_info["available_backups"]:
-                        backup_options = ["Latest backup"] + [b["filename"] for b in backup_info["available_backups"]]
-                        selected_backup = st.selectbox("Select backup to restore", backup_options, key="restore_backup")
-                        
-                        st.warning("⚠️ This will overwrite existing data! Make sure to create a backup first.")
-                        
-                        if st.button("🔄 Restore Backup", type="secondary", use_container_width=True):
-                            try:
-                                backup_file = None if selected_backup == "Latest backup" else selected_backup
-                                success = backup_system.restore_from_backup(backup_file)
-                                if success:
-                                    st.success("✅ Backup restored successfully!")
-                                    st.info("🔄 Please refresh the page to see restored data.")
-                                else:
-                                    st.error("❌ Failed to restore backup")
-                            except Exception as e:
-                                st.error(f"❌ Error restoring backup: {str(e)}")
-                    else:
-                        st.info("📂 No backups available")
-                except Exception as e:
-                    st.warning(f"⚠️ Cannot load backup list: {str(e)}")
-            
-            # Auto-restore status
-            st.markdown("### 🔄 Auto-Restore Status")
-            try:
-                should_restore = backup_system.should_restore_on_startup()
-                if should_restore:
-                    st.warning("⚠️ Database appears empty - auto-restore will activate on next deployment")
-                else:
-                    st.success("✅ Database has sufficient data - auto-restore not needed")
-            except Exception:
-                st.info("ℹ️ Cannot check auto-restore status")
-                
-        except ImportError:
-            st.error("❌ Backup system not available")
-        except Exception as e:
-            st.error(f"❌ Backup system error: {str(e)}")
-        
-        st.markdown("---")
-        
-        # Export Section
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.write("**📤 Export Data**")
-            if st.button("📤 Export Expenses to CSV", use_container_width=True):
-                try:
-                    expenses = services['expense'].get_expenses(user_id, limit=1000)
-                    if expenses:
-                        expense_data = []
-                        for expense in expenses:
-                            expense_data.append({
-                                'Date': expense.expense_date,
-                                'Amount': float(expense.amount),
-                                'Description': expense.description,
-                                'Category': expense.category.value
-                            })
-                        
-                        df = pd.DataFrame(expense_data)
-                        csv = df.to_csv(index=False)
-                        
-                        st.download_button(
-                            label="💾 Download CSV",
-                            data=csv,
-                            file_name=f"expenses_{date.today().strftime('%Y%m%d')}.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-                    else:
-                        st.warning("No expenses to export")
-                except Exception as e:
-                    st.error(f"Error exporting data: {str(e)}")
-        
-        with col2:
-            st.write("**📊 Database Info**")
-            
-            # Show database statistics
-            try:
-                total_expenses = len(services['expense'].get_expenses(user_id, limit=10000))
-                total_income_entries = len(services['budget'].get_income_entries(user_id))
-                total_goals = len(services['budget'].get_all_savings_goals(user_id))
-                
-                st.info(f"""
-                📊 **Database Statistics:**
-                - Total Expenses: {total_expenses}
-                - Income Entries: {total_income_entries}
-                - Savings Goals: {total_goals}
-                """)
-                
-            except Exception as e:
-                st.error(f"Error loading database info: {str(e)}")
-        
-        with col3:
-            st.write("**🔄 Reset Database**")
-            
-            # Warning message
-            st.warning("""
-            ⚠️ **Danger Zone**
-            
-            This will permanently delete ALL your data:
-            - Income entries
-            - Expense records  
-            - Savings goals
-            - All historical data
-            """)
-            
-            # Confirmation checkboxes
-            confirm_reset = st.checkbox(
-                "I understand this will delete all my data",
-                key="confirm_reset_checkbox"
-            )
-            
-            double_confirm = st.checkbox(
-                "I am absolutely sure I want to proceed",
-                key="double_confirm_checkbox",
-                disabled=not confirm_reset
-            )
-            
-            # Reset button (only enabled when both confirmations are checked)
-            reset_enabled = confirm_reset and double_confirm
-            
-            if st.button(
-                "🗑️ RESET DATABASE", 
-                use_container_width=True,
-                disabled=not reset_enabled,
-                type="primary" if reset_enabled else "secondary",
-                help="This action cannot be undone!"
-            ):
-                if reset_enabled:
-                    try:
-                        # Import the required functionality
-                        from pathlib import Path
-                        import os
-                        from budget_manager.core.database import DatabaseManager
-                        
-                        # Get database path - try home directory first, fallback to current directory
-                        try:
-                            import os
-                            if os.environ.get('STREAMLIT_CLOUD_DEPLOYMENT'):
-                                data_dir = Path("./data")
-                            else:
-                                data_dir = Path.home() / ".budget_manager"
-                            db_path = data_dir / "budget.db"
-                        except (PermissionError, OSError):
-                            data_dir = Path("./data")
-                            db_path = data_dir / "budget.db"
-                        
-                        # Delete the database file
-                        if db_path.exists():
-                            os.remove(db_path)
-                        
-                        # Create fresh database with clean tables
-                        DatabaseManager()
-                        
-                        # Clear the cached services to force recreation with new database
-                        st.cache_resource.clear()
-                        
-                        # Show success message
-                        st.success("✅ Database reset successfully! All data has been cleared.")
-                        st.info("🔄 Refreshing page to show clean state...")
-                        
-                        # Auto-refresh the page after a short delay
-                        st.rerun()
-                        
-                    except Exception as e:
-                        st.error(f"❌ Error resetting database: {str(e)}")
-                        st.error("You can also reset manually by running: `python reset_database.py`")
-                else:
-                    st.error("⚠️ Please complete both confirmation steps before proceeding.")
-            
-            if not reset_enabled:
-                if not confirm_reset:
-                    st.caption("✓ Check both boxes above to enable the reset button")
-                elif not double_confirm:
-                    st.caption("✓ Please check the second confirmation box")
+        _data_management_fragment(user_id)
     
     with tab2:
-        st.subheader("📊 Application Preferences")
-        
-        # Database connection info
-        try:
-            from budget_manager.core.database import DatabaseManager
-            
-            db_manager = DatabaseManager()
-            db_info = db_manager.get_connection_info()
-            
-            st.write("**Database Configuration**")
-            
-            if db_info['is_persistent']:
-                st.success(f"✅ **{db_info['database_type']}** - Persistent Storage Enabled")
-                st.caption("Your data will persist across deployments!")
-            else:
-                st.info(f"📱 **{db_info['database_type']}** - Multi-User Ready")
-                st.caption("Perfect for development and testing. Data is isolated per user session.")
-                
-                # Show cloud deployment note
-                with st.expander("☁️ For Production Deployment (Optional)"):
-                    st.markdown("""
-                    ### Free PostgreSQL Options for Cloud Persistence:
-                    
-                    **Option 1: Supabase (Free tier - 500MB)**
-                    1. Go to [supabase.com](https://supabase.com) and create account
-                    2. Create new project → Get PostgreSQL URL
-                    3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
-                    
-                    **Option 2: Neon (Free tier - 3GB)**
-                    1. Go to [neon.tech](https://neon.tech) and create account  
-                    2. Create database → Get connection string
-                    3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
-                    
-                    **Option 3: ElephantSQL (Free tier - 20MB)**
-                    1. Go to [elephantsql.com](https://elephantsql.com)
-                    2. Create "Tiny Turtle" free instance
-                    3. Add as `DATABASE_URL` environment variable in Streamlit Cloud
-                    
-                    **Benefits of PostgreSQL:**
-                    - ✅ Data persists across deployments
-                    - ✅ Better performance for many users
-                    - ✅ Advanced database features
-                    - ✅ Automatic backups
-                    
-                    **Current SQLite is great for:**
-                    - ✅ Development and testing
-                    - ✅ Small to medium user base
-                    - ✅ No external dependencies
-                    - ✅ Fast and reliable
-                    """)
-            
-            # Test database connection
-            if db_manager.test_connection():
-                st.success("🔗 Database connection: OK")
-                
-                # Show multi-user statistics
-                try:
-                    from budget_manager.services.auth_service import AuthService
-                    auth_service = AuthService()
-                    stats = auth_service.get_system_stats()
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("👥 Users", stats['total_users'])
-                    with col2:
-                        st.metric("💰 Income Entries", stats['total_income_entries'])
-                    with col3:
-                        st.metric("💸 Expenses", stats['total_expenses'])
-                    with col4:
-                        st.metric("🎯 Goals", stats['total_savings_goals'])
-                        
-                except Exception:
-                    pass
-            else:
-                st.error("❌ Database connection: Failed")
-                
-        except Exception as e:
-            st.error(f"Error checking database: {str(e)}")
-        
-        st.divider()
-        
-        # Get current preferences
-        prefs = get_user_preferences()
-        
-        # Currency selection
-        st.write("**Currency Settings**")
-        
-        # Get currency choices and current selection
-        currency_choices = [f"{curr.value['code']} ({curr.value['symbol']}) - {curr.value['name']}" for curr in Currency]
-        current_currency = prefs.get_currency()
-        current_choice = f"{current_currency.value['code']} ({current_currency.value['symbol']}) - {current_currency.value['name']}"
-        
-        # Find current index
-        current_index = 0
-        for i, choice in enumerate(currency_choices):
-            if choice == current_choice:
-                current_index = i
-                break
-        
-        selected_currency = st.selectbox(
-            "Currency Display",
-            currency_choices,
-            index=current_index,
-            help="Select your preferred currency for display"
-        )
-        
-        # Update currency if changed
-        if selected_currency != current_choice:
-            # Extract currency code from selection
-            currency_code = selected_currency.split(' ')[0]
-            try:
-                new_currency = Currency[currency_code]
-                prefs.set_currency(new_currency)
-                st.success(f"✅ Currency updated to {new_currency.value['name']}")
-                st.rerun()
-            except KeyError:
-                st.error("Invalid currency selection")
-        
-        # Display formatting options
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Decimal places
-            decimal_places = st.slider(
-                "Decimal Places",
-                min_value=0,
-                max_value=4,
-                value=prefs.get_decimal_places(),
-                help="Number of decimal places to show in currency amounts"
-            )
-            
-            if decimal_places != prefs.get_decimal_places():
-                prefs.set_decimal_places(decimal_places)
-                st.rerun()
-        
-        with col2:
-            # Thousands separator
-            group_thousands = st.checkbox(
-                "Use Thousands Separator",
-                value=prefs.get_group_thousands(),
-                help="Show commas in large numbers (e.g., 1,000.00)"
-            )
-            
-            if group_thousands != prefs.get_group_thousands():
-                prefs.set_group_thousands(group_thousands)
-                st.rerun()
-        
-        # Preview
-        st.write("**Preview:**")
-        sample_amount = Decimal("12345.67")
-        formatted_preview = Formatters.format_currency(sample_amount)
-        st.code(f"Sample amount: {formatted_preview}")
-        
-        st.divider()
-        
-        # Other preferences
-        st.write("**Budget Settings**")
-        
-        # Target date preference
-        target_day = st.slider(
-            "Savings Target Day of Month", 
-            min_value=1, 
-            max_value=28, 
-            value=prefs.get_savings_target_day(),
-            help="Day of the month by which you want to achieve your savings goal"
-        )
-        
-        if target_day != prefs.get_savings_target_day():
-            prefs.set_savings_target_day(target_day)
-            st.success(f"✅ Target day updated to {target_day}")
-        
-        st.divider()
-        
-        # Future features section
-        st.write("**Coming Soon**")
-        
-        # Theme preference (placeholder for future feature)
-        theme = st.selectbox(
-            "Color Theme",
-            ["Default", "Dark", "Light"],
-            disabled=True,
-            help="Theme selection (coming soon)"
-        )
-        
-        # Reset preferences
-        st.write("**Reset Preferences**")
-        if st.button("🔄 Reset All Preferences to Defaults", use_container_width=True):
-            prefs.reset_to_defaults()
-            st.success("✅ All preferences reset to defaults")
-            st.rerun()
+        _preferences_fragment()
     
     with tab4:
         st.subheader("👥 Multi-User System")
         st.info("Your SQLite database supports multiple users with complete data isolation!")
         
         try:
-            from budget_manager.services.auth_service import AuthService
-            auth_service = AuthService()
-            
-            # System overview
-            stats = auth_service.get_system_stats()
-            
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                st.write("**System Overview**")
-                
-                # Create a summary table
-                summary_data = {
-                    "Metric": ["Total Users", "Income Entries", "Expenses", "Savings Goals"],
-                    "Count": [
-                        stats['total_users'], 
-                        stats['total_income_entries'], 
-                        stats['total_expenses'], 
-                        stats['total_savings_goals']
-                    ]
-                }
-                
-                import pandas as pd
-                df_summary = pd.DataFrame(summary_data)
-                st.dataframe(df_summary, use_container_width=True, hide_index=True)
-                
-                # User list
-                st.write("**Active Users**")
-                users = auth_service.get_all_users()
-                
-                if users:
-                    user_data = []
-                    for user in users:
-                        # Get user-specific stats
-                        user_stats = auth_service.get_user_stats(user.id)
-                        user_data.append({
-                            "Username": user.username,
-                            "Full Name": user.full_name or "Not set",
-                            "Email": user.email,
-                            "Income Entries": user_stats['income_entries'] if user_stats else 0,
-                            "Expenses": user_stats['total_expenses'] if user_stats else 0,
-                            "Goals": user_stats['savings_goals'] if user_stats else 0,
-                            "Days Active": user_stats['days_since_registration'] if user_stats else 0
-                        })
-                    
-                    df_users = pd.DataFrame(user_data)
-                    st.dataframe(df_users, use_container_width=True, hide_index=True)
+                # Other users' details and the system-wide queries are for the admin only
+                if not user.is_admin:
+                    st.info("🔒 The system overview and user list are only available to the administrator.")
                 else:
-                    st.info("No users found (should not happen since you're logged in!)")
+                    # System overview
+                    stats = _system_stats()
+                    
+                    st.write("**System Overview**")
+                    
+                    # Summary metrics
+                    metric_cols = st.columns(4)
+                    metric_cols[0].metric("Total Users", stats['total_users'])
+                    metric_cols[1].metric("Income Entries", stats['total_income_entries'])
+                    metric_cols[2].metric("Expenses", stats['total_expenses'])
+                    metric_cols[3].metric("Savings Goals", stats['total_savings_goals'])
+                    
+                    # User list
+                    st.write("**Active Users**")
+                    users, stats_by_user = _users_with_stats()
+                    
+                    if users:
+                        # Only the visible page is turned into a frame and sent to the browser
+                        if len(users) > _USERS_PAGE_SIZE:
+                            page_count = -(-len(users) // _USERS_PAGE_SIZE)
+                            users_page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="users_page")
+                            st.caption(f"Page {users_page} of {page_count} ({len(users)} users)")
+                            users = users[(users_page - 1) * _USERS_PAGE_SIZE:users_page * _USERS_PAGE_SIZE]
+                    
+                        # Build the frame column by column rather than transposing row records
+                        user_stats = [stats_by_user.get(user.id, {}) for user in users]
+                        df_users = pd.DataFrame({
+                            "Username": [user.username for user in users],
+                            "Full Name": [user.full_name or "Not set" for user in users],
+                            "Email": [user.email for user in users],
+                            "Income Entries": [counts.get('income_entries', 0) for counts in user_stats],
+                            "Expenses": [counts.get('total_expenses', 0) for counts in user_stats],
+                            "Goals": [counts.get('savings_goals', 0) for counts in user_stats],
+                            "Days Active": [counts.get('days_since_registration', 0) for counts in user_stats]
+                        })
+                        # Read-only list - a static table is lighter than the interactive grid
+                        st.table(df_users.set_index("Username"))
+                    else:
+                        st.info("No users found (should not happen since you're logged in!)")
             
             with col2:
                 st.write("**Multi-User Features**")
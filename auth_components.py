@@ -2,21 +2,104 @@
 Authentication UI components for the Streamlit multi-user budget manager.
 """
 
+import queue
+import re
+import threading
 import streamlit as st
 from typing import Optional, Dict, Any
 
 from budget_manager.services.auth_service import AuthService, AuthenticationError
 from budget_manager.core.models import UserCreate, UserLogin, UserProfile
 from budget_manager.utils.translations import t, Language, set_language, get_current_language, is_rtl
-from budget_manager.core.user_preferences import get_user_preferences
+from budget_manager.core.user_preferences import UserPreferences, get_user_preferences
+
+
+# Right-to-left styles for the authentication form (Arabic)
+_AUTH_RTL_CSS = """
+<style>
+    .main .block-container {
+        direction: rtl;
+        text-align: right;
+    }
+    .stRadio > label {
+        direction: rtl;
+        text-align: right;
+    }
+    .stTextInput > label {
+        direction: rtl;
+        text-align: right;
+    }
+    .stButton > button {
+        direction: rtl;
+    }
+    .stForm {
+        direction: rtl;
+        text-align: right;
+    }
+    .stMarkdown {
+        direction: rtl;
+        text-align: right;
+    }
+    .stSelectbox > label {
+        direction: rtl;
+        text-align: right;
+    }
+</style>
+"""
+
+# One "@", no whitespace, and a dot in the domain part
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Language selector labels, in display order
+_LANGUAGE_OPTIONS = {
+    Language.ENGLISH: "🇺🇸 English",
+    Language.FRENCH: "🇫🇷 Français",
+    Language.ARABIC: "🇸🇦 العربية"
+}
+_LANGUAGE_KEYS = tuple(_LANGUAGE_OPTIONS)
+
+
+@st.cache_resource
+def _get_auth_service() -> AuthService:
+    """Create the default AuthService (and its database manager) once per process."""
+    return AuthService()
+
+
+def _write_preferences(pending: "queue.Queue[UserPreferences]") -> None:
+    """Save queued preference objects to disk, one at a time, off the rerun path."""
+    while True:
+        prefs = pending.get()
+        try:
+            prefs.save()
+        except Exception:
+            pass
+        finally:
+            pending.task_done()
+
+
+@st.cache_resource
+def _get_preference_saves() -> "queue.Queue[UserPreferences]":
+    """Start the background preferences writer once per process and return its queue."""
+    pending: "queue.Queue[UserPreferences]" = queue.Queue(maxsize=16)
+    threading.Thread(
+        target=_write_preferences, args=(pending,),
+        name="preferences-writer", daemon=True
+    ).start()
+    return pending
 
 
 class AuthUI:
     """Authentication UI handler for Streamlit."""
     
-    def __init__(self):
-        """Initialize authentication UI."""
-        self.auth_service = AuthService()
+    def __init__(self, auth_service: Optional[AuthService] = None):
+        """
+        Initialize authentication UI.
+        
+        Args:
+            auth_service: Authentication service to use. If None, a shared
+                process-wide instance is used.
+        """
+        self.auth_service = auth_service or _get_auth_service()
         
         # Initialize session state for authentication
         if 'authenticated' not in st.session_state:
@@ -44,26 +127,26 @@ class AuthUI:
             st.markdown("---")
             
             current_lang = get_current_language()
-            language_options = {
-                Language.ENGLISH: "🇺🇸 English",
-                Language.FRENCH: "🇫🇷 Français",
-                Language.ARABIC: "🇸🇦 العربية"
-            }
             
             selected_lang = st.selectbox(
                 t("select_language"),
-                options=list(language_options.keys()),
-                format_func=lambda x: language_options[x],
-                index=list(language_options.keys()).index(current_lang),
+                options=_LANGUAGE_KEYS,
+                format_func=_LANGUAGE_OPTIONS.__getitem__,
+                index=_LANGUAGE_KEYS.index(current_lang),
                 key="language_selector"
             )
             
             if selected_lang != current_lang:
                 set_language(selected_lang)
-                # Save to preferences
+                # Update the preference in memory now, so the rerun reads the new
+                # language, and write the file in the background
                 try:
                     prefs = get_user_preferences()
-                    prefs.set_language(selected_lang.value)
+                    prefs.set_language(selected_lang.value, save=False)
+                    try:
+                        _get_preference_saves().put_nowait(prefs)
+                    except queue.Full:
+                        prefs.save()
                 except:
                     pass
                 st.rerun()
@@ -100,39 +183,10 @@ class AuthUI:
         if self.is_authenticated():
             return True
         
-        # Set page config for RTL support
+        # RTL overrides for the auth form; re-sent each rerun since Streamlit
+        # drops elements that a rerun does not emit again
         if is_rtl():
-            st.markdown("""
-            <style>
-            .main .block-container {
-                direction: rtl;
-                text-align: right;
-            }
-            .stRadio > label {
-                direction: rtl;
-                text-align: right;
-            }
-            .stTextInput > label {
-                direction: rtl;
-                text-align: right;
-            }
-            .stButton > button {
-                direction: rtl;
-            }
-            .stForm {
-                direction: rtl;
-                text-align: right;
-            }
-            .stMarkdown {
-                direction: rtl;
-                text-align: right;
-            }
-            .stSelectbox > label {
-                direction: rtl;
-                text-align: right;
-            }
-            </style>
-            """, unsafe_allow_html=True)
+            st.markdown(_AUTH_RTL_CSS, unsafe_allow_html=True)
         
         # Main authentication container
         st.markdown(f"## 🏦 {t('app_title')}")
@@ -192,7 +246,7 @@ class AuthUI:
                         st.session_state.authenticated = True
                         st.session_state.user = user
                         
-                        st.success(t("welcome_back", user.full_name or user.username))
+                        st.success(t("welcome_back", user.display_name))
                         st.rerun()
                         
                     except AuthenticationError as e:
@@ -266,7 +320,7 @@ class AuthUI:
                     if len(password) < 6:
                         errors.append(t("password_min_length"))
                     
-                    if "@" not in email or "." not in email:
+                    if not _EMAIL_RE.match(email):
                         errors.append(t("invalid_email"))
                     
                     if errors:
@@ -349,7 +403,7 @@ class AuthUI:
                     if len(new_password) < 6:
                         errors.append("Password must be at least 6 characters long.")
                     
-                    if "@" not in email or "." not in email:
+                    if not _EMAIL_RE.match(email):
                         errors.append("Please enter a valid email address.")
                     
                     if errors:
@@ -412,7 +466,7 @@ class AuthUI:
         with st.sidebar:
             st.markdown("---")
             st.markdown(f"### 👤 {t('user_account')}")
-            st.markdown(f"**{user.full_name or user.username}**")
+            st.markdown(f"**{user.display_name}**")
             
             # User stats
             try:
@@ -438,7 +492,7 @@ class AuthUI:
         with st.sidebar:
             self.render_language_selector()
         
-        st.markdown(f"# {t('welcome_message', user.full_name or user.username)}")
+        st.markdown(f"# {t('welcome_message', user.display_name)}")
 
 
 def check_authentication() -> Optional[UserProfile]:
@@ -88,7 +88,7 @@ class BackupRestoreSystem:
         """Backup all users (excluding sensitive password data)."""
         with self.db_manager.get_session() as session:
             result = session.execute(text("""
-                SELECT id, username, email, full_name, created_at, last_login, is_active
+                SELECT id, username, email, full_name, created_at, last_login, is_active, is_admin
                 FROM users
                 WHERE is_active = 1
             """))
@@ -184,12 +184,16 @@ class BackupRestoreSystem:
                 ), {"username": user_data["username"]}).fetchone()
                 
                 if not existing:
-                    # Create user with default password (they'll need to change it)
+                    # Create user with default password (they'll need to change it);
+                    # backups made before is_admin existed restore as regular users
                     session.execute(text("""
-                        INSERT INTO users (id, username, email, full_name, created_at, last_login, is_active, password_hash, salt)
-                        VALUES (:id, :username, :email, :full_name, :created_at, :last_login, :is_active, 
+                        INSERT INTO users (id, username, email, full_name, created_at, last_login, is_active, is_admin, password_hash, salt)
+                        VALUES (:id, :username, :email, :full_name, :created_at, :last_login, :is_active, :is_admin,
                                'default_hash_needs_reset', 'default_salt')
-                    """), user_data)
+                    """), {"is_admin": False, **user_data})
+            
+            # Older backups carry no admin; fall back to the first registered user
+            self.db_manager.ensure_admin(session)
         
         print(f"   ✅ Restored {len(users_data)} users")
     
@@ -9,7 +9,7 @@ from typing import Optional, List, Type, TypeVar
 from contextlib import contextmanager
 import time
 
-from sqlalchemy import create_engine, and_
+from sqlalchemy import create_engine, event, inspect, text, and_
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 from sqlalchemy.pool import QueuePool
@@ -18,6 +18,13 @@ from .models import Base, IncomeEntryDB, ExpenseDB, SavingsGoalDB, User
 
 T = TypeVar('T')
 
+# Makes the first registered user the admin while there is no admin
+_ASSIGN_FIRST_ADMIN = text(
+    "UPDATE users SET is_admin = TRUE "
+    "WHERE id = (SELECT MIN(id) FROM users) "
+    "AND NOT EXISTS (SELECT 1 FROM users WHERE is_admin = TRUE)"
+)
+
 
 class DatabaseManager:
     """Manages database connections and operations with PostgreSQL and SQLite support."""
@@ -61,38 +68,40 @@ class DatabaseManager:
                 pool_pre_ping=True
             )
             
-            # Enable SQLite optimizations for multi-user scenarios
-            self._configure_sqlite_for_multiuser()
+            # Enable SQLite optimizations for multi-user scenarios on every pooled connection
+            event.listen(self.engine, "connect", self._configure_sqlite_for_multiuser)
         
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
         # Create tables if they don't exist
         self._create_tables_with_retry()
     
-    def _configure_sqlite_for_multiuser(self) -> None:
-        """Configure SQLite for optimal multi-user performance."""
-        if not self.is_postgres:
-            try:
-                with self.engine.connect() as conn:
-                    # Enable WAL mode for better concurrency
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    
-                    # Enable foreign key constraints
-                    conn.execute("PRAGMA foreign_keys=ON")
-                    
-                    # Optimize for multi-user scenarios
-                    conn.execute("PRAGMA synchronous=NORMAL")  # Good balance of safety vs speed
-                    conn.execute("PRAGMA cache_size=10000")    # Increase cache size
-                    conn.execute("PRAGMA temp_store=MEMORY")   # Store temp data in memory
-                    conn.execute("PRAGMA mmap_size=134217728") # Enable memory mapping (128MB)
-                    
-                    # Set busy timeout to handle concurrent access
-                    conn.execute("PRAGMA busy_timeout=30000")  # 30 second timeout
-                    
-                    conn.commit()
-            except Exception:
-                # If configuration fails, continue with defaults
-                pass
+    @staticmethod
+    def _configure_sqlite_for_multiuser(dbapi_connection, connection_record) -> None:
+        """
+        Configure a new SQLite connection for optimal multi-user performance.
+        
+        Most PRAGMAs only apply to the connection that issues them, so this runs
+        for every connection the pool opens rather than once per engine.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            # Enable WAL mode for better concurrency
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
+            # Optimize for multi-user scenarios
+            cursor.execute("PRAGMA synchronous=NORMAL")  # Good balance of safety vs speed
+            cursor.execute("PRAGMA cache_size=10000")    # Increase cache size
+            cursor.execute("PRAGMA temp_store=MEMORY")   # Store temp data in memory
+            cursor.execute("PRAGMA mmap_size=134217728") # Enable memory mapping (128MB)
+            
+            # Set busy timeout to handle concurrent access
+            cursor.execute("PRAGMA busy_timeout=30000")  # 30 second timeout
+        except Exception:
+            # If configuration fails, continue with defaults
+            pass
+        finally:
+            cursor.close()
     
     def _get_database_url(self) -> str:
         """
@@ -137,6 +146,8 @@ class DatabaseManager:
         for attempt in range(max_retries):
             try:
                 Base.metadata.create_all(bind=self.engine)
+                self._add_missing_columns()
+                self._create_missing_indexes()
                 return
             except OperationalError as e:
                 if attempt < max_retries - 1 and self.is_postgres:
@@ -146,6 +157,35 @@ class DatabaseManager:
             except SQLAlchemyError as e:
                 raise DatabaseError(f"Failed to create database tables: {e}")
     
+    def _add_missing_columns(self) -> None:
+        """Add columns that are missing from tables created by older versions."""
+        user_columns = {column['name'] for column in inspect(self.engine).get_columns('users')}
+        if 'is_admin' not in user_columns:
+            with self.engine.begin() as connection:
+                connection.execute(text("ALTER TABLE users ADD COLUMN is_admin BOOLEAN NOT NULL DEFAULT FALSE"))
+                # The first registered user administers an existing installation
+                connection.execute(_ASSIGN_FIRST_ADMIN)
+    
+    def ensure_admin(self, session: Optional[Session] = None) -> None:
+        """
+        Make the first registered user the admin if no user is an admin.
+        
+        Args:
+            session: Session to run in, so the check commits together with the
+                caller's inserts. If None, it runs in its own transaction.
+        """
+        if session is not None:
+            session.execute(_ASSIGN_FIRST_ADMIN)
+            return
+        with self.engine.begin() as connection:
+            connection.execute(_ASSIGN_FIRST_ADMIN)
+    
+    def _create_missing_indexes(self) -> None:
+        """Create model indexes that are missing from tables created by older versions."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+    
     def get_connection_info(self) -> dict:
         """
         Get information about the current database connection.
@@ -188,7 +228,7 @@ class DatabaseManager:
         """
         try:
             with self.engine.connect() as conn:
-                conn.execute("SELECT 1")
+                conn.execute(text("SELECT 1"))
             return True
         except Exception:
             return False
@@ -364,6 +404,41 @@ class DatabaseManager:
         """
         with self.get_session() as session:
             return query_func(session, *args, **kwargs)
+    
+    def clear_user_data(self, user_id: int) -> int:
+        """
+        Delete a user's income entries, expenses and savings goals in one transaction.
+        
+        Args:
+            user_id: ID of the user whose data is removed; the account itself is kept
+            
+        Returns:
+            Number of rows deleted
+        """
+        with self.get_session() as session:
+            return sum(
+                session.query(model).filter(model.user_id == user_id).delete(synchronize_session=False)
+                for model in (ExpenseDB, IncomeEntryDB, SavingsGoalDB)
+            )
+    
+    def reset_database(self) -> None:
+        """
+        Delete every row from every table in a single transaction.
+        
+        The schema and indexes are kept. Plain DELETEs are used rather than
+        dropping tables because SQLite does not run DDL transactionally, so a
+        failure part-way through rolls back instead of leaving tables missing.
+        
+        Raises:
+            DatabaseError: If the data cannot be deleted
+        """
+        try:
+            with self.engine.begin() as connection:
+                # Children first, so foreign keys never point at deleted users
+                for table in reversed(Base.metadata.sorted_tables):
+                    connection.execute(table.delete())
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to reset database: {e}")
 
 
 class DatabaseError(Exception):
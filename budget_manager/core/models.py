@@ -8,10 +8,11 @@ from decimal import Decimal
 from typing import Optional, List, Dict
 from enum import Enum
 import hashlib
+import hmac
 import secrets
 
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import Column, Integer, String, DateTime, Date, DECIMAL, Text, ForeignKey, UniqueConstraint, Enum as SQLEnum, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Date, DECIMAL, Text, ForeignKey, UniqueConstraint, Index, Enum as SQLEnum, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -45,12 +46,18 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     
     # Relationships
     income_entries: Mapped[List["IncomeEntryDB"]] = relationship("IncomeEntryDB", back_populates="user", cascade="all, delete-orphan")
     expenses: Mapped[List["ExpenseDB"]] = relationship("ExpenseDB", back_populates="user", cascade="all, delete-orphan")
     savings_goals: Mapped[List["SavingsGoalDB"]] = relationship("SavingsGoalDB", back_populates="user", cascade="all, delete-orphan")
     
+    # PBKDF2 work factor for new hashes, sized for roughly 50 ms per hash since
+    # every login blocks the Streamlit script thread; stored hashes record
+    # their own count and are upgraded on login when it changes
+    PASSWORD_ITERATIONS = 150_000
+    
     def set_password(self, password: str) -> None:
         """Hash and set the user's password."""
         self.salt = secrets.token_hex(16)
@@ -58,12 +65,24 @@ class User(Base):
     
     def check_password(self, password: str) -> bool:
         """Check if provided password matches stored hash."""
-        return self.password_hash == self._hash_password(password, self.salt)
+        if self.password_hash.startswith("pbkdf2_sha256$"):
+            _, iterations, _ = self.password_hash.split("$")
+            expected = self._hash_password(password, self.salt, int(iterations))
+        else:
+            # Hashes created before PBKDF2 are a single salted SHA-256 digest
+            expected = hashlib.sha256((password + self.salt).encode()).hexdigest()
+        return hmac.compare_digest(self.password_hash, expected)
+    
+    def password_needs_rehash(self) -> bool:
+        """Check if the stored hash uses an outdated scheme or work factor."""
+        return not self.password_hash.startswith(f"pbkdf2_sha256${self.PASSWORD_ITERATIONS}$")
     
-    @staticmethod
-    def _hash_password(password: str, salt: str) -> str:
-        """Hash password with salt using SHA-256."""
-        return hashlib.sha256((password + salt).encode()).hexdigest()
+    @classmethod
+    def _hash_password(cls, password: str, salt: str, iterations: Optional[int] = None) -> str:
+        """Hash password with salt using PBKDF2-HMAC-SHA256."""
+        iterations = iterations or cls.PASSWORD_ITERATIONS
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), iterations)
+        return f"pbkdf2_sha256${iterations}${digest.hex()}"
     
     def update_last_login(self) -> None:
         """Update the last login timestamp."""
@@ -107,6 +126,12 @@ class ExpenseDB(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="expenses")
+    
+    # Indexes for the per-user date-range and category filters
+    __table_args__ = (
+        Index('ix_expenses_user_date', 'user_id', 'expense_date'),
+        Index('ix_expenses_user_cat_date', 'user_id', 'category', 'expense_date'),
+    )
 
 
 class SavingsGoalDB(Base):
@@ -166,9 +191,15 @@ class UserProfile(BaseModel):
     full_name: Optional[str] = None
     created_at: datetime
     last_login: Optional[datetime] = None
+    is_admin: bool = False
     
     class Config:
         from_attributes = True
+    
+    @property
+    def display_name(self) -> str:
+        """Name to greet the user by: their full name, or the username if none was given."""
+        return self.full_name or self.username
 
 
 class BudgetEntry(BaseModel):
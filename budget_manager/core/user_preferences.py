@@ -5,6 +5,7 @@ Handles storage and retrieval of user settings and preferences.
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from enum import Enum
@@ -33,6 +34,18 @@ class Currency(Enum):
     TRY = {"code": "TRY", "symbol": "₺", "name": "Turkish Lira"}
     TND = {"code": "TND", "symbol": "د.ت", "name": "Tunisian Dinar"}
     NZD = {"code": "NZD", "symbol": "NZ$", "name": "New Zealand Dollar"}
+    
+    @property
+    def label(self) -> str:
+        """Display label for the UI, e.g. 'USD ($) - US Dollar'."""
+        return _CURRENCY_LABELS[self]
+
+
+# Display labels are built once at import time
+_CURRENCY_LABELS = {
+    currency: f"{currency.value['code']} ({currency.value['symbol']}) - {currency.value['name']}"
+    for currency in Currency
+}
 
 
 class UserPreferences:
@@ -65,6 +78,7 @@ class UserPreferences:
                 preferences_file = str(data_dir / "preferences.json")
         
         self.preferences_file = preferences_file
+        self._save_lock = threading.Lock()
         self._preferences = self._load_preferences()
     
     def _load_preferences(self) -> Dict[str, Any]:
@@ -91,8 +105,12 @@ class UserPreferences:
     def _save_preferences(self) -> None:
         """Save preferences to file."""
         try:
-            with open(self.preferences_file, 'w', encoding='utf-8') as f:
-                json.dump(self._preferences, f, indent=2, ensure_ascii=False)
+            # The language selector saves from a background thread, so each save
+            # writes a snapshot and saves never overlap
+            with self._save_lock:
+                snapshot = dict(self._preferences)
+                with open(self.preferences_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
         except IOError as e:
             print(f"Warning: Could not save preferences ({e})")
     
@@ -178,9 +196,21 @@ class UserPreferences:
         """Get the user's language preference."""
         return self._preferences.get("language", "en")
     
-    def set_language(self, language: str) -> None:
-        """Set the user's language preference."""
+    def set_language(self, language: str, save: bool = True) -> None:
+        """
+        Set the user's language preference.
+        
+        Args:
+            language: Language code, e.g. "en"
+            save: Write the preferences file now. If False, only the in-memory
+                value changes and the caller is responsible for calling save().
+        """
         self._preferences["language"] = language
+        if save:
+            self._save_preferences()
+    
+    def save(self) -> None:
+        """Write the current preferences to the preferences file."""
         self._save_preferences()
     
     def get_all_preferences(self) -> Dict[str, Any]:
@@ -209,11 +239,7 @@ class UserPreferences:
     @staticmethod
     def get_currency_choices() -> list:
         """Get currency choices formatted for UI display."""
-        choices = []
-        for currency in Currency:
-            info = currency.value
-            choices.append(f"{info['code']} ({info['symbol']}) - {info['name']}")
-        return choices
+        return [currency.label for currency in Currency]
 
 
 # Global preferences instance
@@ -6,11 +6,12 @@ Handles user registration, login, and session management.
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from ..core.database import DatabaseManager
-from ..core.models import User, UserCreate, UserLogin, UserProfile
+from ..core.models import User, UserCreate, UserLogin, UserProfile, IncomeEntryDB, ExpenseDB, SavingsGoalDB
 
 
 class AuthenticationError(Exception):
@@ -68,6 +69,10 @@ class AuthService:
                 db_user.set_password(user_data.password)
                 
                 session.add(db_user)
+                session.flush()
+                # The first account on a fresh database becomes the admin; decided
+                # by the lowest id in the same transaction as the insert
+                self.db_manager.ensure_admin(session)
                 session.commit()
                 session.refresh(db_user)
                 
@@ -104,6 +109,10 @@ class AuthService:
             if not user.check_password(login_data.password):
                 raise AuthenticationError("Invalid username or password")
             
+            # Upgrade legacy or weaker hashes now that the plain password is known
+            if user.password_needs_rehash():
+                user.set_password(login_data.password)
+            
             # Update last login
             user.update_last_login()
             session.commit()
@@ -278,18 +287,55 @@ class AuthService:
             Dictionary with user statistics or None if user not found
         """
         with self.db_manager.get_session() as session:
-            user = session.query(User).filter(User.id == user_id).first()
+            row = self._user_stats_query(session).filter(User.id == user_id).first()
             
-            if not user:
+            if not row:
                 return None
             
-            return {
-                'income_entries': len(user.income_entries),
-                'total_expenses': len(user.expenses),
-                'savings_goals': len(user.savings_goals),
-                'days_since_registration': (datetime.utcnow() - user.created_at).days,
-                'last_login': user.last_login
-            }
+            return self._user_stats_from_row(row, datetime.utcnow())
+    
+    def get_all_user_stats(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get statistics for every active user in a single query.
+        
+        Returns:
+            Dictionary mapping user IDs to the same statistics as get_user_stats
+        """
+        with self.db_manager.get_session() as session:
+            rows = self._user_stats_query(session).filter(User.is_active == True).all()
+            
+            now = datetime.utcnow()
+            return {row.id: self._user_stats_from_row(row, now) for row in rows}
+    
+    def _user_stats_query(self, session: Session):
+        """Build the per-user statistics query for the given session."""
+        # Count related rows with scalar subqueries in the same round-trip
+        # instead of loading every income entry, expense and goal
+        return session.query(
+            User.id,
+            User.created_at,
+            User.last_login,
+            self._count_subquery(IncomeEntryDB),
+            self._count_subquery(ExpenseDB),
+            self._count_subquery(SavingsGoalDB)
+        )
+    
+    @staticmethod
+    def _user_stats_from_row(row, now: datetime) -> Dict[str, Any]:
+        """Convert a per-user statistics row into the stats dictionary."""
+        _, created_at, last_login, income_entries, total_expenses, savings_goals = row
+        return {
+            'income_entries': income_entries,
+            'total_expenses': total_expenses,
+            'savings_goals': savings_goals,
+            'days_since_registration': (now - created_at).days,
+            'last_login': last_login
+        }
+    
+    @staticmethod
+    def _count_subquery(model):
+        """Build a scalar subquery counting a model's rows for the outer User row."""
+        return select(func.count(model.id)).where(model.user_id == User.id).scalar_subquery()
     
     def get_all_users(self) -> list[UserProfile]:
         """
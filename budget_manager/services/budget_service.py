@@ -5,8 +5,9 @@ Multi-user support with data isolation.
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..core.database import DatabaseManager
@@ -44,50 +45,92 @@ class BudgetService:
         if amount <= 0:
             raise ValueError("Income amount must be positive")
         
+        with self.db_manager.get_session() as session:
+            db_entry = self._upsert_income(session, user_id, amount, month, description)
+            session.commit()
+            session.refresh(db_entry)
+            
+            return self._to_budget_entry(db_entry)
+    
+    def add_income_and_goal(
+        self,
+        user_id: int,
+        income_amount: Decimal,
+        goal_amount: Decimal,
+        month: date,
+        income_description: str = None,
+        goal_description: str = None
+    ) -> Tuple[BudgetEntry, SavingsGoal]:
+        """
+        Add a monthly income entry and set the savings goal in one transaction.
+        
+        Args:
+            user_id: ID of the user
+            income_amount: Income amount
+            goal_amount: Target savings amount
+            month: Month for both (day will be set to 1st)
+            income_description: Optional income description
+            goal_description: Optional goal description
+            
+        Returns:
+            Tuple of the created BudgetEntry and SavingsGoal
+            
+        Raises:
+            ValueError: If either amount is not positive
+        """
+        if income_amount <= 0:
+            raise ValueError("Income amount must be positive")
+        if goal_amount <= 0:
+            raise ValueError("Savings target must be positive")
+        
+        with self.db_manager.get_session() as session:
+            db_entry = self._upsert_income(session, user_id, income_amount, month, income_description)
+            db_goal = self._upsert_savings_goal(session, user_id, goal_amount, month, goal_description)
+            session.commit()
+            session.refresh(db_entry)
+            session.refresh(db_goal)
+            
+            return self._to_budget_entry(db_entry), self._to_savings_goal(db_goal)
+    
+    def _upsert_income(
+        self, session: Session, user_id: int, amount: Decimal, month: date, description: Optional[str]
+    ) -> IncomeEntryDB:
+        """Create or update the income entry for a user and month without committing."""
         # Normalize month to first day
         month = month.replace(day=1)
         
-        with self.db_manager.get_session() as session:
-            # Check if income entry already exists for this user and month
-            existing_entry = session.query(IncomeEntryDB).filter_by(
+        # Check if income entry already exists for this user and month
+        db_entry = session.query(IncomeEntryDB).filter_by(
+            user_id=user_id,
+            month=month
+        ).first()
+        
+        if db_entry:
+            # Update existing entry
+            db_entry.amount = amount
+            db_entry.description = description
+        else:
+            # Create new entry
+            db_entry = IncomeEntryDB(
                 user_id=user_id,
-                month=month
-            ).first()
-            
-            if existing_entry:
-                # Update existing entry
-                existing_entry.amount = amount
-                existing_entry.description = description
-                session.commit()
-                session.refresh(existing_entry)
-                
-                return BudgetEntry(
-                    id=existing_entry.id,
-                    amount=existing_entry.amount,
-                    month=existing_entry.month,
-                    description=existing_entry.description,
-                    created_at=existing_entry.created_at
-                )
-            else:
-                # Create new entry
-                db_entry = IncomeEntryDB(
-                    user_id=user_id,
-                    amount=amount,
-                    month=month,
-                    description=description
-                )
-                
-                session.add(db_entry)
-                session.commit()
-                session.refresh(db_entry)
-                
-                return BudgetEntry(
-                    id=db_entry.id,
-                    amount=db_entry.amount,
-                    month=db_entry.month,
-                    description=db_entry.description,
-                    created_at=db_entry.created_at
-                )
+                amount=amount,
+                month=month,
+                description=description
+            )
+            session.add(db_entry)
+        
+        return db_entry
+    
+    @staticmethod
+    def _to_budget_entry(db_entry: IncomeEntryDB) -> BudgetEntry:
+        """Convert an income entry row into a BudgetEntry."""
+        return BudgetEntry(
+            id=db_entry.id,
+            amount=db_entry.amount,
+            month=db_entry.month,
+            description=db_entry.description,
+            created_at=db_entry.created_at
+        )
     
     def get_monthly_income(self, user_id: int, month: date) -> Decimal:
         """
@@ -143,6 +186,19 @@ class BudgetService:
                 for entry in entries
             ]
     
+    def count_income_entries(self, user_id: int) -> int:
+        """
+        Count the income entries of a user without loading them.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Number of income entries
+        """
+        with self.db_manager.get_session() as session:
+            return session.query(func.count(IncomeEntryDB.id)).filter_by(user_id=user_id).scalar()
+    
     def update_income(self, user_id: int, entry_id: int, amount: Decimal = None, description: str = None) -> Optional[BudgetEntry]:
         """
         Update an existing income entry for a user.
@@ -230,50 +286,52 @@ class BudgetService:
         if target_amount <= 0:
             raise ValueError("Savings target must be positive")
         
+        with self.db_manager.get_session() as session:
+            db_goal = self._upsert_savings_goal(session, user_id, target_amount, month, description)
+            session.commit()
+            session.refresh(db_goal)
+            
+            return self._to_savings_goal(db_goal)
+    
+    def _upsert_savings_goal(
+        self, session: Session, user_id: int, target_amount: Decimal, month: date, description: Optional[str]
+    ) -> SavingsGoalDB:
+        """Create or update the savings goal for a user and month without committing."""
         # Normalize month to first day
         month = month.replace(day=1)
         
-        with self.db_manager.get_session() as session:
-            # Check if goal already exists for this user and month
-            existing_goal = session.query(SavingsGoalDB).filter_by(
+        # Check if goal already exists for this user and month
+        db_goal = session.query(SavingsGoalDB).filter_by(
+            user_id=user_id,
+            month=month
+        ).first()
+        
+        if db_goal:
+            # Update existing goal
+            db_goal.target_amount = target_amount
+            db_goal.description = description
+        else:
+            # Create new goal
+            db_goal = SavingsGoalDB(
                 user_id=user_id,
-                month=month
-            ).first()
-            
-            if existing_goal:
-                # Update existing goal
-                existing_goal.target_amount = target_amount
-                existing_goal.description = description
-                session.commit()
-                session.refresh(existing_goal)
-                
-                return SavingsGoal(
-                    id=existing_goal.id,
-                    target_amount=existing_goal.target_amount,
-                    month=existing_goal.month,
-                    description=existing_goal.description,
-                    created_at=existing_goal.created_at
-                )
-            else:
-                # Create new goal
-                db_goal = SavingsGoalDB(
-                    user_id=user_id,
-                    target_amount=target_amount,
-                    month=month,
-                    description=description
-                )
-                
-                session.add(db_goal)
-                session.commit()
-                session.refresh(db_goal)
-                
-                return SavingsGoal(
-                    id=db_goal.id,
-                    target_amount=db_goal.target_amount,
-                    month=db_goal.month,
-                    description=db_goal.description,
-                    created_at=db_goal.created_at
-                )
+                target_amount=target_amount,
+                month=month,
+                description=description
+            )
+            session.add(db_goal)
+        
+        return db_goal
+    
+    @staticmethod
+    def _to_savings_goal(db_goal: SavingsGoalDB) -> SavingsGoal:
+        """Convert a savings goal row into a SavingsGoal."""
+        return SavingsGoal(
+            id=db_goal.id,
+            target_amount=db_goal.target_amount,
+            month=db_goal.month,
+            description=db_goal.description,
+            created_at=db_goal.created_at
+        )
     
     def get_savings_goal(self, user_id: int, month: date) -> Optional[SavingsGoal]:
         """
@@ -331,6 +389,19 @@ class BudgetService:
                 for goal in goals
             ]
     
+    def count_savings_goals(self, user_id: int) -> int:
+        """
+        Count the savings goals of a user without loading them.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Number of savings goals
+        """
+        with self.db_manager.get_session() as session:
+            return session.query(func.count(SavingsGoalDB.id)).filter_by(user_id=user_id).scalar()
+    
     def delete_savings_goal(self, user_id: int, goal_id: int) -> bool:
         """
         Delete a savings goal for a user.
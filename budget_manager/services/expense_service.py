@@ -5,8 +5,9 @@ Multi-user support with data isolation.
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
+from sqlalchemy import extract, func, insert
 from sqlalchemy.orm import Session
 
 from ..core.database import DatabaseManager
@@ -81,6 +82,52 @@ class ExpenseService:
                 created_at=db_expense.created_at
             )
     
+    def add_expenses(
+        self,
+        user_id: int,
+        expenses: List[Tuple[Decimal, str, ExpenseCategory, date]]
+    ) -> int:
+        """
+        Add several expenses for a specific user in one transaction.
+        
+        The rows are validated like add_expense and written with a single
+        executemany INSERT and one commit.
+        
+        Args:
+            user_id: ID of the user
+            expenses: (amount, description, category, expense_date) tuples;
+                expense_date may be None for today
+            
+        Returns:
+            Number of expenses added
+            
+        Raises:
+            ValueError: If any amount is not positive or any description is empty
+        """
+        rows = []
+        for amount, description, category, expense_date in expenses:
+            if amount <= 0:
+                raise ValueError("Expense amount must be positive")
+            
+            if not description or not description.strip():
+                raise ValueError("Expense description cannot be empty")
+            
+            rows.append({
+                'user_id': user_id,
+                'amount': amount,
+                'description': description.strip(),
+                'category': category,
+                'expense_date': expense_date or date.today()
+            })
+        
+        if not rows:
+            return 0
+        
+        with self.db_manager.get_session() as session:
+            session.execute(insert(ExpenseDB), rows)
+        
+        return len(rows)
+    
     def get_expenses(
         self, 
         user_id: int,
@@ -131,6 +178,46 @@ class ExpenseService:
                 for expense in expenses
             ]
     
+    def count_expenses(self, user_id: int) -> int:
+        """
+        Count the expenses of a user without loading them.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Number of expenses
+        """
+        with self.db_manager.get_session() as session:
+            return session.query(func.count(ExpenseDB.id)).filter_by(user_id=user_id).scalar()
+    
+    def iter_export_rows(self, user_id: int, batch_size: int = 1000) -> Iterator[Tuple[date, Decimal, str, ExpenseCategory]]:
+        """
+        Iterate over all expenses of a user as plain column tuples for export.
+        
+        Only the exported columns are selected and rows are fetched in batches,
+        so no Expense objects are built and memory stays bounded.
+        
+        Args:
+            user_id: ID of the user
+            batch_size: Number of rows fetched from the database at a time
+            
+        Yields:
+            Tuples of (expense_date, amount, description, category), newest first
+        """
+        with self.db_manager.get_session() as session:
+            query = session.query(
+                ExpenseDB.expense_date,
+                ExpenseDB.amount,
+                ExpenseDB.description,
+                ExpenseDB.category
+            ).filter(
+                ExpenseDB.user_id == user_id
+            ).order_by(ExpenseDB.expense_date.desc()).yield_per(batch_size)
+            
+            for row in query:
+                yield tuple(row)
+    
     def get_monthly_expenses(self, user_id: int, month: date) -> List[Expense]:
         """
         Get all expenses for a specific user and month.
@@ -151,6 +238,47 @@ class ExpenseService:
         
         return self.get_expenses(user_id=user_id, start_date=start_date, end_date=end_date)
     
+    def get_monthly_totals(self, user_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        Get expense totals grouped by month for a user.
+        
+        The aggregation runs in a single grouped query instead of loading
+        every expense row for each month.
+        
+        Args:
+            user_id: ID of the user
+            start_date: Start date filter (inclusive)
+            end_date: End date filter (inclusive)
+            
+        Returns:
+            List of dictionaries with 'month' (first day of the month),
+            'total' and 'count', ordered chronologically. Months without
+            expenses are omitted.
+        """
+        with self.db_manager.get_session() as session:
+            year_col = extract('year', ExpenseDB.expense_date)
+            month_col = extract('month', ExpenseDB.expense_date)
+            
+            rows = session.query(
+                year_col,
+                month_col,
+                func.sum(ExpenseDB.amount),
+                func.count(ExpenseDB.id)
+            ).filter(
+                ExpenseDB.user_id == user_id,
+                ExpenseDB.expense_date >= start_date,
+                ExpenseDB.expense_date <= end_date
+            ).group_by(year_col, month_col).order_by(year_col, month_col).all()
+            
+            return [
+                {
+                    'month': date(int(year), int(month), 1),
+                    'total': Decimal(str(total or 0)),
+                    'count': count
+                }
+                for year, month, total, count in rows
+            ]
+    
     def get_today_expenses(self, user_id: int) -> List[Expense]:
         """
         Get expenses for today for a specific user.
@@ -297,14 +425,73 @@ class ExpenseService:
         Returns:
             Total expense amount
         """
-        expenses = self.get_expenses(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
-            category=category
-        )
+        with self.db_manager.get_session() as session:
+            query = session.query(func.sum(ExpenseDB.amount)).filter(ExpenseDB.user_id == user_id)
+            
+            if start_date:
+                query = query.filter(ExpenseDB.expense_date >= start_date)
+            if end_date:
+                query = query.filter(ExpenseDB.expense_date <= end_date)
+            if category:
+                query = query.filter(ExpenseDB.category == category)
+            
+            total = query.scalar()
+            return Decimal(str(total)) if total is not None else Decimal('0')
+    
+    def get_today_total(self, user_id: int) -> Decimal:
+        """
+        Get the total amount spent today by a specific user.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Total of today's expenses
+        """
+        today = date.today()
+        return self.get_total_expenses(user_id=user_id, start_date=today, end_date=today)
+    
+    def get_expense_summary(
+        self,
+        user_id: int,
+        start_date: date = None,
+        end_date: date = None,
+        category: ExpenseCategory = None
+    ) -> Dict[ExpenseCategory, Tuple[Decimal, int]]:
+        """
+        Get expense totals and counts per category in a single grouped query.
         
-        return sum(expense.amount for expense in expenses)
+        Args:
+            user_id: ID of the user
+            start_date: Start date filter (inclusive)
+            end_date: End date filter (inclusive)
+            category: Category filter
+            
+        Returns:
+            Dictionary mapping each category with expenses to a
+            (total, count) tuple, largest total first
+        """
+        with self.db_manager.get_session() as session:
+            total_col = func.sum(ExpenseDB.amount)
+            query = session.query(
+                ExpenseDB.category,
+                total_col,
+                func.count(ExpenseDB.id)
+            ).filter(ExpenseDB.user_id == user_id)
+            
+            if start_date:
+                query = query.filter(ExpenseDB.expense_date >= start_date)
+            if end_date:
+                query = query.filter(ExpenseDB.expense_date <= end_date)
+            if category:
+                query = query.filter(ExpenseDB.category == category)
+            
+            rows = query.group_by(ExpenseDB.category).order_by(total_col.desc()).all()
+            
+            return {
+                row_category: (Decimal(str(total or 0)), count)
+                for row_category, total, count in rows
+            }
     
     def get_category_breakdown(
         self, 
@@ -323,18 +510,8 @@ class ExpenseService:
         Returns:
             Dictionary mapping category names to total amounts
         """
-        expenses = self.get_expenses(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        breakdown = {}
-        for expense in expenses:
-            category_name = expense.category.value
-            breakdown[category_name] = breakdown.get(category_name, Decimal('0')) + expense.amount
-        
-        return breakdown
+        summary = self.get_expense_summary(user_id, start_date, end_date)
+        return {category.value: total for category, (total, _) in summary.items()}
     
     def get_available_categories(self) -> List[ExpenseCategory]:
         """
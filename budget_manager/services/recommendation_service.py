@@ -5,7 +5,7 @@ Multi-user support with data isolation.
 
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 
 from ..core.calculator import BudgetCalculator
 from ..core.models import DailyRecommendation, BudgetSummary
@@ -187,13 +187,103 @@ class RecommendationService:
         if month is None:
             month = date.today()
         
-        alerts = []
-        
         # Get recommendation and summary
         recommendation = self.get_daily_recommendation(user_id=user_id, month=month)
         summary = self.get_monthly_summary(user_id=user_id, month=month)
         prediction = self.predict_monthly_outcome(user_id=user_id, month=month)
         
+        category_breakdown = None
+        if recommendation and summary:
+            category_breakdown = self._current_month_breakdown(user_id, month)
+        
+        return self._build_alerts(recommendation, summary, prediction, category_breakdown)
+    
+    def get_dashboard_bundle(self, user_id: int, month: date = None) -> Dict[str, Any]:
+        """
+        Get the daily recommendation, monthly summary, smart alerts and
+        savings progress for a specific user in one pass.
+        
+        The month's income, savings goal and expenses are loaded once and
+        shared by all four results, instead of being queried again by each
+        of the individual getters.
+        
+        Args:
+            user_id: ID of the user
+            month: Month to analyze (default: current month)
+            
+        Returns:
+            Dictionary with 'recommendation', 'summary', 'alerts' and 'progress'
+        """
+        if month is None:
+            month = date.today()
+        month_start = month.replace(day=1)
+        
+        income_entries = self.budget_service.get_income_entries(
+            user_id=user_id,
+            start_month=month, 
+            end_month=month
+        )
+        savings_goal = self.budget_service.get_savings_goal(user_id, month)
+        expenses = self.expense_service.get_monthly_expenses(user_id, month)
+        
+        monthly_income = next(
+            (entry.amount for entry in income_entries if entry.month == month_start),
+            Decimal('0')
+        )
+        
+        recommendation = None
+        prediction = None
+        if monthly_income > 0:
+            if savings_goal:
+                recommendation = self.calculator.calculate_daily_recommendation(
+                    monthly_income=monthly_income,
+                    savings_target=savings_goal.target_amount,
+                    current_month_expenses=expenses
+                )
+            prediction = self.calculator.predict_monthly_outcome(
+                monthly_income=monthly_income,
+                current_expenses=expenses
+            )
+        
+        summary = self.calculator.calculate_monthly_summary(
+            month=month,
+            income_entries=income_entries,
+            expenses=expenses,
+            savings_goal=savings_goal
+        )
+        
+        category_breakdown = None
+        if recommendation and summary:
+            category_breakdown = self._current_month_breakdown(user_id, month)
+        
+        return {
+            'recommendation': recommendation,
+            'summary': summary,
+            'alerts': self._build_alerts(recommendation, summary, prediction, category_breakdown),
+            'progress': self._build_savings_progress(summary)
+        }
+    
+    def _current_month_breakdown(self, user_id: int, month: date) -> Optional[Dict[str, Decimal]]:
+        """Category spending so far this month, or None if month is not the current month."""
+        today = date.today()
+        if month.month != today.month or month.year != today.year:
+            return None
+        return self.expense_service.get_category_breakdown(
+            user_id=user_id,
+            start_date=month.replace(day=1),
+            end_date=today
+        )
+    
+    def _build_alerts(
+        self,
+        recommendation: Optional[DailyRecommendation],
+        summary: Optional[BudgetSummary],
+        prediction: Optional[Dict[str, Decimal]],
+        category_breakdown: Optional[Dict[str, Decimal]]
+    ) -> List[Dict[str, str]]:
+        """Build smart alerts from already loaded recommendation data."""
+        alerts = []
+        
         if not recommendation or not summary:
             alerts.append({
                 'type': 'setup',
@@ -231,14 +321,7 @@ class RecommendationService:
                 })
         
         # Check category spending
-        today = date.today()
-        if month.month == today.month and month.year == today.year:
-            category_breakdown = self.expense_service.get_category_breakdown(
-                user_id=user_id,
-                start_date=month.replace(day=1),
-                end_date=today
-            )
-            
+        if category_breakdown is not None:
             # Alert if any category is over 40% of total spending
             total_spent = sum(category_breakdown.values())
             if total_spent > 0:
@@ -276,7 +359,10 @@ class RecommendationService:
         if month is None:
             month = date.today()
         
-        summary = self.get_monthly_summary(user_id=user_id, month=month)
+        return self._build_savings_progress(self.get_monthly_summary(user_id=user_id, month=month))
+    
+    def _build_savings_progress(self, summary: Optional[BudgetSummary]) -> Optional[Dict[str, any]]:
+        """Build savings progress data from a monthly summary."""
         if not summary:
             return None
         
@@ -3,10 +3,23 @@ Formatting utilities for the budget manager.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Any
 from datetime import date
 
 
+@lru_cache(maxsize=4096)
+def _format_currency_cached(amount: Decimal, currency_symbol: str,
+                            decimal_places: int, group_thousands: bool) -> str:
+    """Format an amount with explicit settings, memoized since amounts repeat across a page."""
+    if group_thousands:
+        formatted_amount = f"{amount:,.{decimal_places}f}"
+    else:
+        formatted_amount = f"{amount:.{decimal_places}f}"
+    
+    return f"{currency_symbol}{formatted_amount}"
+
+
 class Formatters:
     """Utility class for formatting data for display."""
     
@@ -37,13 +50,7 @@ class Formatters:
             if group_thousands is None:
                 group_thousands = prefs.get_group_thousands()
             
-            # Format the number
-            if group_thousands:
-                formatted_amount = f"{amount:,.{decimal_places}f}"
-            else:
-                formatted_amount = f"{amount:.{decimal_places}f}"
-            
-            return f"{currency_symbol}{formatted_amount}"
+            return _format_currency_cached(amount, currency_symbol, decimal_places, group_thousands)
             
         except ImportError:
             # Fallback if preferences not available
@@ -3,6 +3,7 @@ Internationalization (i18n) system for Smart Budget Manager.
 Supports English, French, and Arabic with RTL layout for Arabic.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from enum import Enum
 
@@ -518,7 +519,21 @@ class TranslationManager:
         Returns:
             Translated text
         """
-        translations = self.translations.get(self.current_language, {})
+        return self.translate_to(self.current_language, key, *args)
+    
+    def translate_to(self, language: Language, key: str, *args) -> str:
+        """
+        Get translated text for the given key in a specific language.
+        
+        Args:
+            language: Language to translate into
+            key: Translation key
+            *args: Format arguments
+            
+        Returns:
+            Translated text
+        """
+        translations = self.translations.get(language, {})
         text = translations.get(key, key)  # Fallback to key if not found
         
         # Format with arguments if provided
@@ -548,6 +563,12 @@ def get_translation_manager() -> TranslationManager:
     return _translation_manager
 
 
+@lru_cache(maxsize=4096)
+def _translate_cached(language: Language, key: str, args: tuple) -> str:
+    """Translate a key for one language, memoized since the tables never change at runtime."""
+    return _translation_manager.translate_to(language, key, *args)
+
+
 def t(key: str, *args) -> str:
     """
     Shorthand function for translation.
@@ -559,7 +580,11 @@ def t(key: str, *args) -> str:
     Returns:
         Translated text
     """
-    return _translation_manager.translate(key, *args)
+    try:
+        return _translate_cached(_translation_manager.current_language, key, args)
+    except TypeError:
+        # Unhashable format arguments cannot be memoized
+        return _translation_manager.translate(key, *args)
 
 
 def set_language(language: Language) -> None:
@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the service and database tests.
+"""
+
+import pytest
+
+from budget_manager.core.database import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database manager backed by a fresh temporary SQLite database."""
+    return DatabaseManager(f"sqlite:///{tmp_path / 'budget.db'}")
@@ -0,0 +1,88 @@
+"""
+Tests for the authentication service user statistics and password hashing.
+"""
+
+import hashlib
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from budget_manager.core.models import ExpenseCategory, User, UserCreate, UserLogin
+from budget_manager.services.auth_service import AuthService
+from budget_manager.services.budget_service import BudgetService
+from budget_manager.services.expense_service import ExpenseService
+
+
+class TestAuthService:
+    """Test cases for AuthService statistics queries."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, db_manager):
+        """Register a user with some income, goal and expense rows."""
+        self.service = AuthService(db_manager)
+        self.user = self.service.register_user(UserCreate(
+            username="alice", email="alice@example.com", password="secret1"
+        ))
+
+        budget_service = BudgetService(db_manager)
+        expense_service = ExpenseService(db_manager)
+        budget_service.add_income(self.user.id, Decimal('3000.00'), date(2024, 1, 1))
+        budget_service.set_savings_goal(self.user.id, Decimal('500.00'), date(2024, 1, 1))
+        expense_service.add_expense(self.user.id, Decimal('25.50'), "Lunch", ExpenseCategory.FOOD, date(2024, 1, 5))
+        expense_service.add_expense(self.user.id, Decimal('50.00'), "Gas", ExpenseCategory.TRANSPORTATION, date(2024, 1, 20))
+
+    def test_user_stats_counts_related_rows(self):
+        """Test that user stats count income entries, expenses and goals."""
+        stats = self.service.get_user_stats(self.user.id)
+
+        assert stats['income_entries'] == 1
+        assert stats['total_expenses'] == 2
+        assert stats['savings_goals'] == 1
+        assert stats['days_since_registration'] == 0
+
+    def test_user_stats_unknown_user(self):
+        """Test that stats for a missing user are None."""
+        assert self.service.get_user_stats(999) is None
+
+    def test_all_user_stats_matches_single_user_stats(self):
+        """Test that the bulk stats agree with the per-user stats for every user."""
+        other = self.service.register_user(UserCreate(
+            username="bob", email="bob@example.com", password="secret2"
+        ))
+
+        all_stats = self.service.get_all_user_stats()
+
+        assert set(all_stats) == {self.user.id, other.id}
+        assert all_stats[self.user.id] == self.service.get_user_stats(self.user.id)
+        assert all_stats[other.id]['total_expenses'] == 0
+
+    def test_passwords_are_stored_as_pbkdf2(self):
+        """Test that new passwords use the encoded PBKDF2 format and still verify."""
+        profile = self.service.login_user(UserLogin(username="alice", password="secret1"))
+
+        with self.service.db_manager.get_session() as session:
+            user = session.query(User).filter(User.id == profile.id).first()
+            assert user.password_hash.startswith(f"pbkdf2_sha256${User.PASSWORD_ITERATIONS}$")
+            assert not user.check_password("wrong-password")
+
+    def test_login_upgrades_legacy_sha256_hash(self):
+        """Test that a pre-PBKDF2 hash still logs in and is rehashed on success."""
+        with self.service.db_manager.get_session() as session:
+            user = session.query(User).filter(User.id == self.user.id).first()
+            user.password_hash = hashlib.sha256(("secret1" + user.salt).encode()).hexdigest()
+
+        self.service.login_user(UserLogin(username="alice", password="secret1"))
+
+        with self.service.db_manager.get_session() as session:
+            user = session.query(User).filter(User.id == self.user.id).first()
+            assert not user.password_needs_rehash()
+            assert user.check_password("secret1")
+
+    def test_display_name_falls_back_to_username(self):
+        """Test that profiles are greeted by full name when set, else by username."""
+        named = self.service.register_user(UserCreate(
+            username="carol", email="carol@example.com", password="secret3", full_name="Carol Smith"
+        ))
+
+        assert self.user.display_name == "alice"
+        assert named.display_name == "Carol Smith"
@@ -0,0 +1,48 @@
+"""
+Tests for the budget service income and savings goal writes.
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from budget_manager.services.budget_service import BudgetService
+
+
+class TestBudgetService:
+    """Test cases for BudgetService income and goal upserts."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, db_manager):
+        """Set up the budget service on an empty database."""
+        self.service = BudgetService(db_manager)
+        self.user_id = 1
+
+    def test_add_income_and_goal_writes_both(self):
+        """Test that income and goal are stored for the normalized month."""
+        entry, goal = self.service.add_income_and_goal(
+            self.user_id, Decimal('3000.00'), Decimal('600.00'), date(2024, 1, 15),
+            income_description="Salary", goal_description="Emergency fund"
+        )
+
+        assert entry.month == goal.month == date(2024, 1, 1)
+        assert self.service.get_monthly_income(self.user_id, date(2024, 1, 1)) == Decimal('3000.00')
+        assert self.service.get_savings_goal(self.user_id, date(2024, 1, 1)).target_amount == Decimal('600.00')
+
+    def test_add_income_and_goal_updates_existing_rows(self):
+        """Test that repeating the call updates the month's rows instead of duplicating them."""
+        self.service.add_income(self.user_id, Decimal('2500.00'), date(2024, 1, 1))
+        entry, goal = self.service.add_income_and_goal(
+            self.user_id, Decimal('3000.00'), Decimal('600.00'), date(2024, 1, 1)
+        )
+
+        assert self.service.count_income_entries(self.user_id) == 1
+        assert self.service.count_savings_goals(self.user_id) == 1
+        assert entry.amount == Decimal('3000.00')
+
+    def test_add_income_and_goal_rejects_invalid_goal(self):
+        """Test that an invalid goal stops the income from being written too."""
+        with pytest.raises(ValueError):
+            self.service.add_income_and_goal(self.user_id, Decimal('3000.00'), Decimal('0'), date(2024, 1, 1))
+
+        assert self.service.count_income_entries(self.user_id) == 0
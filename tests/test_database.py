@@ -0,0 +1,88 @@
+"""
+Tests for the database manager maintenance helpers.
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import inspect, text
+
+from budget_manager.core.database import DatabaseManager
+from budget_manager.core.models import ExpenseCategory, UserCreate
+from budget_manager.services.auth_service import AuthService
+from budget_manager.services.budget_service import BudgetService
+from budget_manager.services.expense_service import ExpenseService
+
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager data clearing, reset and schema upgrades."""
+
+    @pytest.fixture(autouse=True)
+    def setup_database(self, db_manager):
+        """Set up two users with income, goal and expense rows."""
+        self.db_manager = db_manager
+        self.auth_service = AuthService(self.db_manager)
+        self.expense_service = ExpenseService(self.db_manager)
+        budget_service = BudgetService(self.db_manager)
+
+        self.user = self.auth_service.register_user(UserCreate(
+            username="alice", email="alice@example.com", password="secret1"
+        ))
+        self.other = self.auth_service.register_user(UserCreate(
+            username="bob", email="bob@example.com", password="secret2"
+        ))
+        for user in (self.user, self.other):
+            budget_service.add_income(user.id, Decimal('3000.00'), date(2024, 1, 1))
+            budget_service.set_savings_goal(user.id, Decimal('500.00'), date(2024, 1, 1))
+            self.expense_service.add_expense(user.id, Decimal('25.50'), "Lunch", ExpenseCategory.FOOD, date(2024, 1, 5))
+
+    def test_clear_user_data_keeps_account_and_other_users(self):
+        """Test that clearing one user's data leaves their account and other users intact."""
+        deleted = self.db_manager.clear_user_data(self.user.id)
+
+        stats = self.auth_service.get_all_user_stats()
+        assert deleted == 3
+        assert (stats[self.user.id]['income_entries'], stats[self.user.id]['total_expenses'],
+                stats[self.user.id]['savings_goals']) == (0, 0, 0)
+        assert stats[self.other.id]['total_expenses'] == 1
+
+    def test_reset_database_empties_every_table(self):
+        """Test that a reset removes every row but keeps the schema and indexes."""
+        self.db_manager.reset_database()
+
+        index_names = {index['name'] for index in inspect(self.db_manager.engine).get_indexes('expenses')}
+        assert self.auth_service.get_all_users() == []
+        assert self.expense_service.count_expenses(self.other.id) == 0
+        assert 'ix_expenses_user_date' in index_names
+
+    def test_first_user_is_admin(self):
+        """Test that only the first account registered on a fresh database is the admin."""
+        assert self.user.is_admin
+        assert not self.other.is_admin
+
+    def test_missing_admin_column_is_added_and_backfilled(self):
+        """Test that a users table from an older version gains is_admin for its first user."""
+        with self.db_manager.engine.begin() as connection:
+            connection.execute(text("ALTER TABLE users DROP COLUMN is_admin"))
+
+        db_manager = DatabaseManager(self.db_manager.db_url)
+
+        users = {user.id: user for user in AuthService(db_manager).get_all_users()}
+        assert users[self.user.id].is_admin
+        assert not users[self.other.id].is_admin
+
+    def test_ensure_admin_assigns_first_user_only_when_none(self):
+        """Test that a database without an admin gets its first user as admin, and only then."""
+        with self.db_manager.engine.begin() as connection:
+            connection.execute(text("UPDATE users SET is_admin = FALSE"))
+            connection.execute(text("UPDATE users SET is_admin = TRUE WHERE id = :id"), {"id": self.other.id})
+
+        self.db_manager.ensure_admin()
+        assert [user.is_admin for user in self.auth_service.get_all_users()] == [False, True]
+
+        with self.db_manager.engine.begin() as connection:
+            connection.execute(text("UPDATE users SET is_admin = FALSE"))
+
+        self.db_manager.ensure_admin()
+        assert [user.is_admin for user in self.auth_service.get_all_users()] == [True, False]
@@ -0,0 +1,117 @@
+"""
+Tests for the expense service query helpers.
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import inspect
+
+from budget_manager.core.models import ExpenseCategory
+from budget_manager.services.expense_service import ExpenseService
+
+
+class TestExpenseService:
+    """Test cases for ExpenseService aggregate queries."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, db_manager):
+        """Add expenses for two users across several months."""
+        self.service = ExpenseService(db_manager)
+        self.user_id = 1
+        self.other_user_id = 2
+
+        self.service.add_expense(self.user_id, Decimal('25.50'), "Lunch", ExpenseCategory.FOOD, date(2024, 1, 5))
+        self.service.add_expense(self.user_id, Decimal('50.00'), "Gas", ExpenseCategory.TRANSPORTATION, date(2024, 1, 20))
+        self.service.add_expense(self.user_id, Decimal('10.25'), "Coffee", ExpenseCategory.FOOD, date(2024, 3, 1))
+        self.service.add_expense(self.other_user_id, Decimal('99.99'), "Movie", ExpenseCategory.ENTERTAINMENT, date(2024, 1, 10))
+
+    def test_monthly_totals_grouped_by_month(self):
+        """Test that monthly totals are aggregated per month for one user."""
+        totals = self.service.get_monthly_totals(self.user_id, date(2024, 1, 1), date(2024, 3, 31))
+
+        assert totals == [
+            {'month': date(2024, 1, 1), 'total': Decimal('75.50'), 'count': 2},
+            {'month': date(2024, 3, 1), 'total': Decimal('10.25'), 'count': 1},
+        ]
+
+    def test_monthly_totals_respects_date_range(self):
+        """Test that monthly totals only include expenses in the range."""
+        totals = self.service.get_monthly_totals(self.user_id, date(2024, 1, 10), date(2024, 2, 29))
+
+        assert totals == [{'month': date(2024, 1, 1), 'total': Decimal('50.00'), 'count': 1}]
+
+    def test_expense_filter_indexes_exist(self):
+        """Test that the composite indexes backing expense filters are created."""
+        indexes = {index['name']: index['column_names']
+                   for index in inspect(self.service.db_manager.engine).get_indexes('expenses')}
+
+        assert indexes['ix_expenses_user_date'] == ['user_id', 'expense_date']
+        assert indexes['ix_expenses_user_cat_date'] == ['user_id', 'category', 'expense_date']
+
+    def test_total_expenses_sums_in_sql(self):
+        """Test that totals honour the user, date range and category filters."""
+        assert self.service.get_total_expenses(self.user_id) == Decimal('85.75')
+        assert self.service.get_total_expenses(self.user_id, date(2024, 1, 1), date(2024, 1, 31)) == Decimal('75.50')
+        assert self.service.get_total_expenses(self.user_id, category=ExpenseCategory.FOOD) == Decimal('35.75')
+
+    def test_total_expenses_without_rows_is_zero(self):
+        """Test that an empty selection totals to zero rather than None."""
+        assert self.service.get_total_expenses(self.user_id, date(2023, 1, 1), date(2023, 12, 31)) == Decimal('0')
+        assert self.service.get_today_total(3) == Decimal('0')
+
+    def test_expense_summary_groups_by_category(self):
+        """Test that the summary totals and counts expenses per category."""
+        summary = self.service.get_expense_summary(self.user_id)
+
+        assert summary == {
+            ExpenseCategory.TRANSPORTATION: (Decimal('50.00'), 1),
+            ExpenseCategory.FOOD: (Decimal('35.75'), 2),
+        }
+        assert list(summary) == [ExpenseCategory.TRANSPORTATION, ExpenseCategory.FOOD]
+        assert self.service.get_expense_summary(self.user_id, start_date=date(2024, 2, 1)) == {
+            ExpenseCategory.FOOD: (Decimal('10.25'), 1)
+        }
+        assert self.service.get_category_breakdown(self.user_id) == {
+            'transportation': Decimal('50.00'),
+            'food': Decimal('35.75'),
+        }
+
+    def test_add_expenses_inserts_all_rows(self):
+        """Test that bulk-added expenses are stored for the user with defaults applied."""
+        added = self.service.add_expenses(3, [
+            (Decimal('12.00'), " Snacks ", ExpenseCategory.FOOD, date(2024, 2, 1)),
+            (Decimal('8.00'), "Bus", ExpenseCategory.TRANSPORTATION, date(2024, 2, 2)),
+        ])
+
+        expenses = self.service.get_expenses(3)
+        assert added == 2
+        assert [expense.description for expense in expenses] == ["Bus", "Snacks"]
+        assert all(expense.created_at is not None for expense in expenses)
+
+    def test_add_expenses_rejects_invalid_rows(self):
+        """Test that one invalid row stops the whole batch."""
+        with pytest.raises(ValueError):
+            self.service.add_expenses(3, [
+                (Decimal('12.00'), "Snacks", ExpenseCategory.FOOD, date(2024, 2, 1)),
+                (Decimal('0'), "Nothing", ExpenseCategory.OTHER, date(2024, 2, 2)),
+            ])
+
+        assert self.service.count_expenses(3) == 0
+
+    def test_count_expenses_per_user(self):
+        """Test that expense counts are isolated per user."""
+        assert self.service.count_expenses(self.user_id) == 3
+        assert self.service.count_expenses(self.other_user_id) == 1
+        assert self.service.count_expenses(3) == 0
+
+    def test_iter_export_rows_yields_column_tuples(self):
+        """Test that export rows contain only the exported columns, newest first."""
+        rows = list(self.service.iter_export_rows(self.user_id, batch_size=2))
+
+        assert rows == [
+            (date(2024, 3, 1), Decimal('10.25'), "Coffee", ExpenseCategory.FOOD),
+            (date(2024, 1, 20), Decimal('50.00'), "Gas", ExpenseCategory.TRANSPORTATION),
+            (date(2024, 1, 5), Decimal('25.50'), "Lunch", ExpenseCategory.FOOD),
+        ]
@@ -0,0 +1,47 @@
+"""
+Tests for the recommendation service dashboard bundle.
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from budget_manager.core.models import ExpenseCategory
+from budget_manager.services.budget_service import BudgetService
+from budget_manager.services.expense_service import ExpenseService
+from budget_manager.services.recommendation_service import RecommendationService
+
+
+class TestRecommendationService:
+    """Test cases for RecommendationService dashboard data."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, db_manager):
+        """Add this month's income, goal and expenses for one user."""
+        self.service = RecommendationService(db_manager)
+        self.user_id = 1
+        self.month = date.today().replace(day=1)
+
+        budget_service = BudgetService(db_manager)
+        expense_service = ExpenseService(db_manager)
+        budget_service.add_income(self.user_id, Decimal('3000.00'), self.month)
+        budget_service.set_savings_goal(self.user_id, Decimal('500.00'), self.month)
+        expense_service.add_expense(self.user_id, Decimal('900.00'), "Electricity", ExpenseCategory.UTILITIES, self.month)
+        expense_service.add_expense(self.user_id, Decimal('25.50'), "Lunch", ExpenseCategory.FOOD, self.month)
+
+    def test_dashboard_bundle_matches_individual_getters(self):
+        """Test that the bundle returns the same results as the separate getters."""
+        bundle = self.service.get_dashboard_bundle(self.user_id, self.month)
+
+        assert bundle['recommendation'] == self.service.get_daily_recommendation(self.user_id, month=self.month)
+        assert bundle['summary'] == self.service.get_monthly_summary(self.user_id, self.month)
+        assert bundle['alerts'] == self.service.get_smart_alerts(self.user_id, self.month)
+        assert bundle['progress'] == self.service.get_savings_progress(self.user_id, self.month)
+        assert any(alert['type'] == 'category' for alert in bundle['alerts'])
+
+    def test_dashboard_bundle_without_income(self):
+        """Test that a user without income gets the setup alert and no recommendation."""
+        bundle = self.service.get_dashboard_bundle(2, self.month)
+
+        assert bundle['recommendation'] is None
+        assert [alert['type'] for alert in bundle['alerts']] == ['setup']